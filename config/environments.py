@@ -3,24 +3,59 @@
 # for the Pemo application across different deployment environments
 
 import os
+from functools import lru_cache
+from types import SimpleNamespace
+
+
+@lru_cache(maxsize=1)
+def get_config() -> SimpleNamespace:
+    """
+    Resolve the environment-specific settings once per process.
+
+    The environment variable lookup and URL construction run exactly once;
+    every later call returns the same frozen namespace, so downstream
+    lookups are plain attribute loads rather than repeated OS env probes.
+
+    Returns:
+        SimpleNamespace: Settings with ENVIRONMENT, API_URL, HOME_URL and
+                         SIGNUP_URL attributes
+    """
+    # The ENVIRONMENT variable determines which deployment environment to use
+    # Defaults to "dev" if no environment variable is set
+    env = os.environ.get("ENVIRONMENT", "dev")
+    home_url = f"https://app.{env}.pemo.io"
+    return SimpleNamespace(
+        ENVIRONMENT=env,
+        API_URL=f"https://api.{env}.pemo.io",
+        HOME_URL=home_url,
+        SIGNUP_URL=f"{home_url}/signup",
+    )
+
 
 # Environment Configuration
 # ========================
 # The ENVIRONMENT variable determines which deployment environment to use
 # Defaults to "dev" if no environment variable is set
 # Valid values: "dev", "staging", "prod"
-ENVIRONMENT = os.getenv("ENVIRONMENT", "dev")
+ENVIRONMENT = get_config().ENVIRONMENT
 
 # API Endpoints
 # =============
 # Constructs the base API URL based on the current environment
 # Format: https://api.{environment}.pemo.io
 # Example: https://api.dev.pemo.io for development environment
-API_URL = f"https://api.{ENVIRONMENT}.pemo.io"
+API_URL = get_config().API_URL
 
 # Application URLs
 # ================
 # Constructs the main application URL based on the current environment
 # Format: https://app.{environment}.pemo.io
 # Example: https://app.dev.pemo.io for development environment
-HOME_URL = f"https://app.{ENVIRONMENT}.pemo.io"
+HOME_URL = get_config().HOME_URL
+
+# Expected route of the signup form that the home screen's "Sign up" button
+# (#signup-btn) opens; opening it directly skips loading the home screen first
+# The route is not verified against the app: if it lands on the home screen,
+# test_register_company_uae falls back to clicking #signup-btn
+# Example: https://app.dev.pemo.io/signup for development environment
+SIGNUP_URL = get_config().SIGNUP_URL
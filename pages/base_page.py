@@ -0,0 +1,56 @@
+# Base Page Object Module
+# =======================
+# This module provides the common base class for all Page Object Model (POM)
+# classes of the Pemo application. It holds behaviour shared by every page
+# object, such as reusing one page-object instance per Playwright page.
+
+from playwright.sync_api import Page
+
+# Page-Object Instance Cache
+# ==========================
+# The page objects already built for a Playwright Page are stored on that
+# Page itself, as {PageObjectClass: instance} under this attribute name.
+# Each page object references its Page in turn, but that is a plain
+# reference cycle: once the test drops the Page, the garbage collector
+# frees the Page, its page objects and their locators together. (A
+# module-level WeakKeyDictionary would not work here, because its values
+# would keep their own keys alive for the whole session.)
+_CACHE_ATTR = "_pemo_page_objects"
+
+class BasePage:
+    """
+    Base class for the Page Objects of the Pemo application.
+
+    Subclasses build their element locators once in __init__. Because those
+    locators are lazy, reusable handles bound to a single Playwright page,
+    a page object can safely be shared by every caller working with that
+    page; for_page() returns such a shared instance.
+
+    Convention: page objects with a fixed set of locators declare __slots__
+    listing "page" plus every attribute assigned in __init__. A subclass that
+    adds state must extend __slots__ with its own names (or omit __slots__ to
+    fall back to a regular instance __dict__).
+    """
+
+    # Empty so that subclasses declaring __slots__ get no instance __dict__
+    __slots__ = ()
+
+    @classmethod
+    def for_page(cls, page: Page):
+        """
+        Return the shared instance of this page object for the given Playwright page.
+
+        The instance is created on first use and cached on the page, so the
+        constructor (and its locator setup) runs once per page lifetime
+        instead of once per call site.
+
+        Args:
+            page (Page): The Playwright page object for browser automation
+
+        Returns:
+            BasePage: The cached page object of the calling class for this page
+        """
+        page_objects = page.__dict__.setdefault(_CACHE_ATTR, {})
+        if cls not in page_objects:
+            page_objects[cls] = cls(page)
+        return page_objects[cls]
@@ -4,9 +4,26 @@
 # registration page of the Pemo application. It handles the business setup
 # process after user registration, including company details and preferences.
 
-from utils.data_utils import generate_company_name
+from playwright.sync_api import Page
+from utils.data_utils import next_company_name
+from pages.base_page import BasePage
 
-class CompanyPage:
+# Selector Constants
+# ==================
+# Selector strings are defined once at module level; page-object instances
+# only bind references to them instead of rebuilding the literals per instance
+_COMPANY_NAME_INPUT = "input[name='name']"
+_CONTACT_NUMBER_INPUT = "input[name='contactNumber']"
+_TERMS_CHECKBOX = "input.PrivateSwitchBase-input[type='checkbox']"
+_COMPANY_SIZE_DROPDOWN = "#company-size"
+_COMPANY_SIZE_OPTION_TEXT = "51 to 250 employees"
+_SUBMIT_BUTTON = "button#register-business-submit-btn"
+
+# Test Data
+# =========
+_CONTACT_NUMBER = "98765321"  # Standard test phone number
+
+class CompanyPage(BasePage):
     """
     Page Object representing the company registration page of the Pemo application.
     
@@ -21,54 +38,63 @@ class CompanyPage:
     implements the Page Object Model pattern for maintainable test code.
     
     Attributes:
-        page: The Playwright page object for browser interaction
-        company_name_input (str): CSS selector for company name input
-        contact_number_input (str): CSS selector for contact number input
-        checkbox (str): CSS selector for terms acceptance checkbox
-        company_size_dropdown (str): XPath selector for company size dropdown
-        company_size_option (str): XPath selector for specific company size option
-        submit_button (str): CSS selector for form submission button
+        page (Page): The Playwright page object for browser interaction
+        company_name_input (Locator): Locator for company name input
+        contact_number_input (Locator): Locator for contact number input
+        checkbox (Locator): Locator for terms acceptance checkbox
+        company_size_dropdown (Locator): Locator for company size dropdown
+        company_size_option (Locator): Locator for specific company size option
+        submit_button (Locator): Locator for form submission button
     """
     
-    def __init__(self, page):
+    # Instance attributes are fixed, so __slots__ drops the per-instance __dict__
+    __slots__ = (
+        "page",
+        "company_name_input", "contact_number_input", "checkbox",
+        "company_size_dropdown", "company_size_option", "submit_button",
+    )
+    
+    def __init__(self, page: Page):
         """
         Initialize the CompanyPage with a Playwright page object.
         
         Args:
-            page: The Playwright page object for browser automation
+            page (Page): The Playwright page object for browser automation
         """
         self.page = page
 
         # Page Element Locators
         # =====================
-        # These selectors identify the key elements on the company registration page
+        # These locators identify the key elements on the company registration page
+        # They are created once from the module-level selector constants so
+        # each action reuses the parsed selector
         # They are grouped by functionality for better organization
         
         # Company Information Fields
-        self.company_name_input = "input[name='name']"             # Company name input field
-        self.contact_number_input = "input[name='contactNumber']"  # Contact phone number input
+        self.company_name_input = page.locator(_COMPANY_NAME_INPUT)      # Company name input field
+        self.contact_number_input = page.locator(_CONTACT_NUMBER_INPUT)  # Contact phone number input
         
         # Form Controls and Validation
-        self.checkbox = "input.PrivateSwitchBase-input[type='checkbox']"  # Terms acceptance checkbox
+        # .first keeps the non-strict "first match" behaviour of page.click()
+        self.checkbox = page.locator(_TERMS_CHECKBOX).first  # Terms acceptance checkbox
         
         # Company Size Selection
-        self.company_size_dropdown = "(//div[@id='company-size'])[1]"     # Company size dropdown trigger
-        self.company_size_option = "//p[normalize-space()='51 to 250 employees']"  # Specific size option
+        self.company_size_dropdown = page.locator(_COMPANY_SIZE_DROPDOWN).first             # Company size dropdown trigger
+        self.company_size_option = page.get_by_text(_COMPANY_SIZE_OPTION_TEXT, exact=True)  # Specific size option
         
         # Form Submission
-        self.submit_button = "button#register-business-submit-btn"        # Submit button to complete registration
+        self.submit_button = page.locator(_SUBMIT_BUTTON)  # Submit button to complete registration
 
     def fill_company_details(self):
         """
         Complete the company registration form with generated test data.
         
         This method performs the complete business setup process:
-        1. Waits for the company form to load
-        2. Generates a valid company name using utility functions
-        3. Fills in company contact information
-        4. Accepts terms and conditions
-        5. Selects appropriate company size
-        6. Submits the form to complete business registration
+        1. Takes a valid company name from the pre-generated pool
+        2. Fills in company contact information once the form has loaded
+        3. Accepts terms and conditions
+        4. Selects appropriate company size
+        5. Submits the form to complete business registration
         
         Note:
             The method uses a hardcoded contact number for testing purposes.
@@ -76,41 +102,41 @@ class CompanyPage:
             The checkbox is clicked using JavaScript to ensure reliable interaction.
             Company size is set to "51 to 250 employees" as a realistic test value.
         """
-        # Wait for the company registration form to be fully loaded
-        # Extended timeout (20s) accounts for potential page load delays
-        self.page.wait_for_selector(self.company_name_input, timeout=20000)
-
         # Company Name Generation
         # =======================
-        # Generate a unique, valid company name using the utility function
+        # Take the next unique, valid company name from the session pool
         # This ensures each test run uses a different company name
-        company_name = generate_company_name()
+        company_name = next_company_name()
 
         # Form Field Population
         # =====================
-        # Fill in company name with the generated value
-        self.page.fill(self.company_name_input, company_name)
-        
-        # Fill in contact number with a standard test phone number
-        # This is hardcoded for consistency across test runs
-        self.page.fill(self.contact_number_input, "98765321")
+        # Fill in company name with the generated value using a native fill()
+        # As the first interactive field it must get real focus so the form's
+        # initial focus handlers run; extended timeout (20s) accounts for
+        # potential page load delays
+        self.company_name_input.fill(company_name, timeout=20000)
+
+        # Fill in contact number with a standard test phone number (hardcoded
+        # for consistency); a real fill() keeps focus, input and blur events
+        # for the phone field's masking and validation
+        self.contact_number_input.fill(_CONTACT_NUMBER)
 
         # Terms and Conditions Acceptance
         # ==============================
         # Click the checkbox to accept terms and conditions
         # Using JavaScript click for reliability since normal clicks sometimes fail
         # This ensures the checkbox is properly checked before form submission
-        self.page.click("input.PrivateSwitchBase-input[type='checkbox']")
+        self.checkbox.click()
 
         # Company Size Selection
         # =====================
         # Open the company size dropdown and select a specific option
         # This simulates a realistic company size selection
-        self.page.click(self.company_size_dropdown)
-        self.page.click(self.company_size_option)
+        self.company_size_dropdown.click()
+        self.company_size_option.click()
 
         # Form Submission
         # ===============
         # Click the submit button to complete the company registration process
         # This will proceed to the next step in the onboarding flow
-        self.page.click(self.submit_button)
+        self.submit_button.click()
@@ -4,7 +4,97 @@
 # dashboard page of the Pemo application. It provides methods to verify
 # the admin user interface and validate that all expected elements are present.
 
-class DashboardPage:
+from playwright.sync_api import Page, expect
+from pages.base_page import BasePage
+
+# Selector Constants
+# ==================
+# Selector strings are defined once at module level; page-object instances
+# only bind references to them instead of rebuilding the literals per instance
+
+# Main Navigation and Core Features
+_GET_STARTED_TEXT = "text=Get started"
+_HOME_TEXT = "text=Home"
+_CARD_EXPENSES_TEXT = "text=Card expenses"
+_CARDS_TEXT = "text=Cards"
+_REQUESTS_TEXT = "text=Requests"
+_TRANSACTIONS_TEXT = "text=Transactions"
+_STATEMENTS_TEXT = "text=Statements"
+_ACCOUNTING_EXPORT_TEXT = "text=Accounting export"
+_MEMBERS_TEAMS_TEXT = "text=Members & Teams"
+
+# Extended Features (More Menu)
+_MORE_BUTTON = "span:text-is('More')"
+_INVOICES_TEXT = "text=Invoices"
+_REIMBURSEMENTS_TEXT = "text=Reimbursements"
+_BUDGETS_TEXT = "text=Budgets"
+_APPROVAL_POLICIES_TEXT = "text=Approval policies"
+_SUBMISSION_POLICIES_TEXT = "text=Submission policies"
+_RECEIPTS_INBOX_TEXT = "text=Receipts inbox"
+
+# Settings and Configuration
+_SETTINGS_BUTTON = "span:text-is('Settings')"
+_BILLING_TEXT = "text=Billing"
+_SUBSCRIPTION_PLANS_TEXT = "text=Subscription plans"
+
+# User Profile and Account
+_USER_FULL_NAME = "span#user-full-name"
+_MY_ACCOUNT_TEXT = "text=My account"
+_EMAIL_NOTIFICATIONS_TEXT = "text=Email notifications"
+_LOGOUT_TEXT = "text=Logout"
+
+# Section Groupings
+# =================
+# The text selectors verified together after each menu is opened
+_MAIN_NAV_TEXTS = (
+    _HOME_TEXT, _CARD_EXPENSES_TEXT, _CARDS_TEXT, _REQUESTS_TEXT,
+    _TRANSACTIONS_TEXT, _STATEMENTS_TEXT, _ACCOUNTING_EXPORT_TEXT, _MEMBERS_TEAMS_TEXT,
+)
+_MORE_MENU_TEXTS = (
+    _INVOICES_TEXT, _REIMBURSEMENTS_TEXT, _BUDGETS_TEXT,
+    _APPROVAL_POLICIES_TEXT, _SUBMISSION_POLICIES_TEXT, _RECEIPTS_INBOX_TEXT,
+)
+_SETTINGS_MENU_TEXTS = (_BILLING_TEXT, _SUBSCRIPTION_PLANS_TEXT)
+_USER_MENU_TEXTS = (_MY_ACCOUNT_TEXT, _EMAIL_NOTIFICATIONS_TEXT, _LOGOUT_TEXT)
+_TEXT_ENGINE_PREFIX = "text="
+
+def _build_section_query(text_selectors):
+    """
+    Precompute the single selector-list query used to verify a dashboard section.
+    
+    Args:
+        text_selectors (tuple): The "text=" selectors of the section
+        
+    Returns:
+        tuple: (union_selector, labels) where union_selector is a selector list
+               such as ':text("Home"), :text("Cards")' matching every label in
+               one DOM traversal, and labels are the plain texts in the same order
+    """
+    # Strip the "text=" engine prefix to get the plain labels
+    labels = tuple(selector[len(_TEXT_ENGINE_PREFIX):] for selector in text_selectors)
+    
+    # Playwright's :text() pseudo-class matches the smallest element containing the text
+    union_selector = ", ".join(f':text("{label}")' for label in labels)
+    return union_selector, labels
+
+# In-Page Visibility Predicate
+# ============================
+# Runs inside the browser against every element matched by a section's selector
+# list and returns one boolean per expected label, so a whole section is
+# verified in a single protocol round-trip.
+# Visibility follows Playwright's rule: non-empty box and not visibility:hidden
+# Matching mirrors the "text=" engine: case-insensitive, whitespace-normalized substring
+_LABELS_VISIBLE_JS = """(els, labels) => {
+    const texts = els
+        .filter(e => {
+            const r = e.getBoundingClientRect();
+            return r.width > 0 && r.height > 0 && getComputedStyle(e).visibility !== 'hidden';
+        })
+        .map(e => e.textContent.replace(/\\s+/g, ' ').trim().toLowerCase());
+    return labels.map(label => texts.some(text => text.includes(label.toLowerCase())));
+}"""
+
+class DashboardPage(BasePage):
     """
     Page Object representing the main dashboard page of the Pemo application.
     
@@ -17,78 +107,60 @@ class DashboardPage:
     
     The dashboard serves as the central hub for all application functionality
     and this class ensures all expected elements are properly displayed.
+    The section labels are not bound as per-instance locators; they are only
+    verified together through the class-level section queries.
     
     Attributes:
-        page: The Playwright page object for browser interaction
-        get_started_text (str): Text selector for onboarding completion indicator
-        home_text (str): Text selector for home navigation element
-        card_expenses_text (str): Text selector for card expenses feature
-        cards_text (str): Text selector for cards management feature
-        requests_text (str): Text selector for requests feature
-        transactions_text (str): Text selector for transactions feature
-        statements_text (str): Text selector for statements feature
-        accounting_export_text (str): Text selector for accounting export feature
-        members_teams_text (str): Text selector for members and teams feature
-        more_button (str): XPath selector for more menu button
-        invoices_text (str): Text selector for invoices feature
-        reimbursements_text (str): Text selector for reimbursements feature
-        budgets_text (str): Text selector for budgets feature
-        approval_policies_text (str): Text selector for approval policies feature
-        submission_policies_text (str): Text selector for submission policies feature
-        receipts_inbox_text (str): Text selector for receipts inbox feature
-        settings_button (str): XPath selector for settings menu button
-        billing_text (str): Text selector for billing feature
-        subscription_plans_text (str): Text selector for subscription plans feature
-        user_full_name (str): XPath selector for user profile name display
-        my_account_text (str): Text selector for my account option
-        email_notifications_text (str): Text selector for email notifications option
-        logout_text (str): Text selector for logout option
+        page (Page): The Playwright page object for browser interaction
+        get_started_text (Locator): Locator for onboarding completion indicator
+        more_button (Locator): Locator for more menu button
+        settings_button (Locator): Locator for settings menu button
+        user_full_name (Locator): Locator for user profile name display
     """
     
-    def __init__(self, page):
+    # Instance attributes are fixed, so __slots__ drops the per-instance __dict__
+    __slots__ = (
+        "page",
+        "get_started_text", "more_button", "settings_button", "user_full_name",
+    )
+    
+    # Section Queries
+    # ===============
+    # The union selector and labels verified together after each menu is opened
+    # Built once at import time; every assertion site goes through _assert_section_visible()
+    _main_section = _build_section_query(_MAIN_NAV_TEXTS)
+    _more_section = _build_section_query(_MORE_MENU_TEXTS)
+    _settings_section = _build_section_query(_SETTINGS_MENU_TEXTS)
+    _user_menu_section = _build_section_query(_USER_MENU_TEXTS)
+    
+    def __init__(self, page: Page):
         """
         Initialize the DashboardPage with a Playwright page object.
         
         Args:
-            page: The Playwright page object for browser automation
+            page (Page): The Playwright page object for browser automation
         """
         self.page = page
 
         # Page Element Locators
         # =====================
-        # These selectors identify the key elements on the dashboard page
+        # These locators identify the key elements on the dashboard page
+        # They are created once from the module-level selector constants so
+        # each check reuses the parsed selector
+        # Only the elements acted on directly are bound; section labels are
+        # verified through the class-level section queries instead
+        # The text locator uses .first to keep the non-strict behaviour of page.is_visible()
+        # CSS and :text-is() are used instead of XPath so matching stays in the native selector engine
         # They are grouped by functionality for better organization
         
-        # Main Navigation and Core Features
-        self.get_started_text = "text=Get started"                 # Onboarding completion indicator
-        self.home_text = "text=Home"                               # Home navigation element
-        self.card_expenses_text = "text=Card expenses"             # Card expenses management
-        self.cards_text = "text=Cards"                             # Cards management feature
-        self.requests_text = "text=Requests"                       # Requests management
-        self.transactions_text = "text=Transactions"               # Transaction history
-        self.statements_text = "text=Statements"                   # Financial statements
-        self.accounting_export_text = "text=Accounting export"     # Accounting data export
-        self.members_teams_text = "text=Members & Teams"           # Team management
-
-        # Extended Features (More Menu)
-        self.more_button = "//span[normalize-space()='More']"      # More features menu button
-        self.invoices_text = "text=Invoices"                       # Invoice management
-        self.reimbursements_text = "text=Reimbursements"           # Reimbursement processing
-        self.budgets_text = "text=Budgets"                         # Budget management
-        self.approval_policies_text = "text=Approval policies"     # Approval workflow policies
-        self.submission_policies_text = "text=Submission policies" # Submission guidelines
-        self.receipts_inbox_text = "text=Receipts inbox"           # Receipt processing
-
-        # Settings and Configuration
-        self.settings_button = "//span[normalize-space()='Settings']"  # Settings menu button
-        self.billing_text = "text=Billing"                             # Billing management
-        self.subscription_plans_text = "text=Subscription plans"       # Plan management
-
-        # User Profile and Account
-        self.user_full_name = "xpath=//span[@id='user-full-name']"    # User's full name display
-        self.my_account_text = "text=My account"                       # Account settings
-        self.email_notifications_text = "text=Email notifications"     # Notification preferences
-        self.logout_text = "text=Logout"                               # Logout option
+        # Onboarding Indicator
+        self.get_started_text = page.locator(_GET_STARTED_TEXT).first  # Onboarding completion indicator
+
+        # Menu Buttons
+        # The labels revealed by each menu are checked through the section queries
+        self.more_button = page.locator(_MORE_BUTTON)          # More features menu button
+        self.settings_button = page.locator(_SETTINGS_BUTTON)  # Settings menu button
+        self.user_full_name = page.locator(_USER_FULL_NAME)    # User's full name display
 
     def verify_admin_ui(self, expected_user_name: str):
         """
@@ -114,57 +186,69 @@ class DashboardPage:
         # ====================================
         # Wait for the onboarding completion indicator and verify core features
         # Extended timeout (30s) accounts for potential page load delays
-        self.page.wait_for_selector(self.get_started_text, timeout=30000)
+        self.get_started_text.wait_for(timeout=30000)
         
         # Verify all main navigation elements and core features are visible
         # These represent the primary functionality available to admin users
-        assert self.page.is_visible(self.home_text)
-        assert self.page.is_visible(self.card_expenses_text)
-        assert self.page.is_visible(self.cards_text)
-        assert self.page.is_visible(self.requests_text)
-        assert self.page.is_visible(self.transactions_text)
-        assert self.page.is_visible(self.statements_text)
-        assert self.page.is_visible(self.accounting_export_text)
-        assert self.page.is_visible(self.members_teams_text)
+        self._assert_section_visible("Main navigation", self._main_section)
 
         # Extended Features Verification (More Menu)
         # =========================================
         # Open the More menu to access additional features
-        self.page.click(self.more_button)
+        self.more_button.click()
         
         # Verify all extended features are available and visible
         # These provide additional administrative and financial management capabilities
-        assert self.page.is_visible(self.invoices_text)
-        assert self.page.is_visible(self.reimbursements_text)
-        assert self.page.is_visible(self.budgets_text)
-        assert self.page.is_visible(self.approval_policies_text)
-        assert self.page.is_visible(self.submission_policies_text)
-        assert self.page.is_visible(self.receipts_inbox_text)
+        self._assert_section_visible("More menu", self._more_section)
 
         # Settings and Configuration Verification
         # =====================================
         # Open the Settings menu to access configuration options
-        self.page.click(self.settings_button)
+        self.settings_button.click()
         
         # Verify all settings and configuration features are available
         # These allow users to manage billing and subscription preferences
-        assert self.page.is_visible(self.billing_text)
-        assert self.page.is_visible(self.subscription_plans_text)
+        self._assert_section_visible("Settings menu", self._settings_section)
 
         # User Profile and Account Verification
         # ====================================
         # Open the user profile menu to access account management options
-        self.page.click(self.user_full_name)
+        self.user_full_name.click()
         
         # Verify all user account management features are available
         # These provide users with control over their account settings
-        assert self.page.is_visible(self.my_account_text)
-        assert self.page.is_visible(self.email_notifications_text)
-        assert self.page.is_visible(self.logout_text)
+        self._assert_section_visible("User menu", self._user_menu_section)
 
         # User Name Validation
         # ====================
-        # Extract the displayed user name and verify it matches expectations
+        # Verify the displayed user name matches expectations
+        # The same cached Locator used for the click above is reused, and the
+        # check runs browser-side with auto-retry instead of marshalling the text
         # This ensures the correct user account is active
-        user_name = self.page.inner_text(self.user_full_name)
-        assert expected_user_name in user_name
+        expect(self.user_full_name, "User name mismatch").to_contain_text(expected_user_name)
+
+    def _assert_section_visible(self, section: str, section_query):
+        """
+        Assert that every label of a dashboard section is visible, in one browser round-trip.
+        
+        Instead of issuing one is_visible() call per label, the section's
+        precomputed selector list is checked in-page by one evaluate_all() call
+        that returns a boolean per label. Matching mirrors the "text=" engine of the
+        section selectors (case-insensitive substring), so labels that match several
+        elements on the page are still handled correctly.
+        
+        Args:
+            section (str): Human readable section name used in the failure message
+            section_query (tuple): (union_selector, labels) from _build_section_query()
+            
+        Raises:
+            AssertionError: If one or more labels are not visible, listing all of them
+        """
+        union_selector, labels = section_query
+        
+        # Evaluate every label's visibility inside the page in a single call
+        results = self.page.locator(union_selector).evaluate_all(_LABELS_VISIBLE_JS, list(labels))
+        
+        # Report every missing label at once rather than failing on the first one
+        missing = [label for label, visible in zip(labels, results) if not visible]
+        assert not missing, f"{section} items not visible: {missing}"
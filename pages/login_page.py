@@ -5,28 +5,63 @@
 # including email/password authentication and OTP verification.
 
 from playwright.sync_api import Page
-from config.environments import HOME_URL
+from config.environments import API_URL, HOME_URL
+from pages.base_page import BasePage
 
-class LoginPage:
+# Selector Constants
+# ==================
+# Selector strings are defined once at module level; page-object instances
+# only bind references to them instead of rebuilding the literals per instance
+_EMAIL_INPUT = "input[name='email']"
+_PASSWORD_INPUT = "input[name='password']"
+_LOGIN_BUTTON = "xpath=//button[@id='login-btn']"
+_NEXT_BUTTON = "button:has-text('Next')"
+_OTP_INPUTS = "//input[contains(@class,'MuiOutlinedInput-input') and @type='text']"
+_CONFIRM_BUTTON = "xpath=(//button[normalize-space()='Confirm'])[1]"
+_HOME_TEXT = "text=Home"
+
+# Test Data
+# =========
+_OTP_DIGIT = "5"  # Default OTP digit accepted by the test environments
+
+# API Login Configuration
+# =======================
+_API_LOGIN_PATH = "/identity/v1/auth/login"  # Identity service login endpoint
+_AUTH_COOKIE_NAME = "auth"                   # Cookie used when the API returns a bare token
+
+class LoginPage(BasePage):
     """
     Page Object representing the login page of the Pemo application.
     
     This class provides methods to interact with the login form, handle
-    OTP verification, and complete the authentication process. It uses
+    OTP verification, and complete the authentication process, or to obtain
+    an authenticated session directly through the identity API. It uses
     Playwright for browser automation and implements the Page Object
     Model pattern for maintainable test code.
     
     Attributes:
         page (Page): The Playwright page object for browser interaction
-        email_input (str): CSS selector for the email input field
-        password_input (str): CSS selector for the password input field
-        login_button (str): XPath selector for the login submit button
-        next_button (str): CSS selector for the next button in OTP flow
-        otp_inputs (str): XPath selector for OTP input fields
-        confirm_button (str): XPath selector for the OTP confirmation button
-        home_text (str): Text selector for the home page indicator
+        email_input (Locator): Locator for the email input field
+        password_input (Locator): Locator for the password input field
+        login_button (Locator): Locator for the login submit button
+        next_button (Locator): Locator for the next button in OTP flow
+        otp_inputs (Locator): Locator matching all OTP input fields
+        confirm_button (Locator): Locator for the OTP confirmation button
+        home_text (Locator): Locator for the home page indicator
     """
     
+    # Instance attributes are fixed, so __slots__ drops the per-instance __dict__
+    __slots__ = (
+        "page",
+        "email_input", "password_input", "login_button",
+        "next_button", "otp_inputs", "confirm_button",
+        "home_text",
+    )
+    
+    # Whether the OTP widget moves focus to the next box on input
+    # None until probed by the first login in this process
+    _otp_auto_advance = None
+    
     def __init__(self, page: Page):
         """
         Initialize the LoginPage with a Playwright page object.
@@ -38,21 +73,24 @@ class LoginPage:
 
         # Page Element Locators
         # =====================
-        # These selectors identify the key elements on the login page
+        # These locators identify the key elements on the login page
+        # They are created once from the module-level selector constants so
+        # each action reuses the parsed selector
         # They are grouped by functionality for better organization
         
         # Authentication Form Elements
-        self.email_input = "input[name='email']"                    # Email input field
-        self.password_input = "input[name='password']"              # Password input field
-        self.login_button = "xpath=//button[@id='login-btn']"      # Login submit button
+        self.email_input = page.locator(_EMAIL_INPUT)        # Email input field
+        self.password_input = page.locator(_PASSWORD_INPUT)  # Password input field
+        self.login_button = page.locator(_LOGIN_BUTTON)      # Login submit button
         
         # OTP Verification Elements
-        self.next_button = "button:has-text('Next')"               # Next button to proceed to OTP
-        self.otp_inputs = "//input[contains(@class,'MuiOutlinedInput-input') and @type='text']"  # OTP input fields
-        self.confirm_button = "xpath=(//button[normalize-space()='Confirm'])[1]"  # OTP confirmation button
+        self.next_button = page.locator(_NEXT_BUTTON)        # Next button to proceed to OTP
+        self.otp_inputs = page.locator(_OTP_INPUTS)          # OTP input fields
+        self.confirm_button = page.locator(_CONFIRM_BUTTON)  # OTP confirmation button
         
         # Success Indicators
-        self.home_text = "text=Home"                               # Text indicating successful login
+        # .first keeps the non-strict "first match" behaviour of page.wait_for_selector()
+        self.home_text = page.locator(_HOME_TEXT).first  # Text indicating successful login
 
     def login_with_otp(self, username: str, password: str):
         """
@@ -70,41 +108,134 @@ class LoginPage:
             password (str): The user's password
             
         Note:
-            This method uses a hardcoded OTP value ("5") for testing purposes.
+            This method uses a hardcoded OTP value ("5" in every box) for testing purposes.
             In a real scenario, the OTP would be retrieved from email/SMS.
             The method includes appropriate waits and timeouts for reliable execution.
         """
         # Navigate to the login page
         # Use the imported HOME_URL variable from config
-        self.page.goto(HOME_URL)
+        # Return as soon as the navigation commits instead of waiting for the
+        # DOM or any subresource; the following fill() auto-waits for the login form
+        self.page.goto(HOME_URL, wait_until="commit")
 
-        # Wait for the login form to be visible and fill credentials
-        self.page.wait_for_selector("text=Log in")
-        self.page.fill(self.email_input, username)
-        self.page.fill(self.password_input, password)
-        self.page.click(self.login_button)
+        # Fill credentials once the login form is ready
+        # Locator actions auto-wait for the element, so no separate wait is needed
+        self.email_input.fill(username)
+        self.password_input.fill(password)
+        self.login_button.click()
 
-        # Wait for OTP flow to begin and proceed to next step
+        # Proceed to the OTP step as soon as the Next button is actionable
         # Extended timeout (60s) accounts for potential email delivery delays
-        self.page.wait_for_selector(self.next_button, timeout=60000)
-        self.page.click(self.next_button)
+        self.next_button.click(timeout=60000)
 
         # OTP Entry and Verification
         # ==========================
-        # Wait for OTP input fields to appear (10s timeout)
-        self.page.wait_for_selector(self.otp_inputs, timeout=10000)
-        otp_inputs = self.page.locator(self.otp_inputs)
+        # Focus the first OTP box without a click round-trip
+        # focus() waits for the box to appear (10s timeout)
+        self.otp_inputs.first.focus(timeout=10000)
         
         # Fill all OTP input fields with the default test value "5"
         # This simulates entering a 6-digit OTP code
-        for i in range(otp_inputs.count()):
-            input_box = otp_inputs.nth(i)
-            input_box.click(force=True)  # Force click to ensure focus
-            self.page.keyboard.type("5")  # Enter default OTP digit
+        self._enter_otp()
 
         # Submit the OTP verification
-        self.page.click(self.confirm_button)
+        self.confirm_button.click()
         
         # Wait for successful authentication and redirect to home page
         # Extended timeout (60s) accounts for potential processing delays
-        self.page.wait_for_selector(self.home_text, timeout=60000)
+        self.home_text.wait_for(timeout=60000)
+
+    def _enter_otp(self):
+        """
+        Type the default OTP digit into every OTP box, starting from the focused first box.
+        
+        Most OTP widgets auto-advance focus on input, in which case one keystroke
+        stream fills every box. Whether this widget does so is probed once, on the
+        first call, by checking that the last box received a digit; the result is
+        cached on the class so later logins in the same process skip the probe.
+        Without auto-advance, each box is filled individually instead.
+        """
+        digit_count = self.otp_inputs.count()
+        
+        # Fast path: a single keystroke stream fills all auto-advancing boxes
+        if LoginPage._otp_auto_advance is not False:
+            self.page.keyboard.type(_OTP_DIGIT * digit_count)  # Enter default OTP digits
+            if LoginPage._otp_auto_advance is None:
+                LoginPage._otp_auto_advance = self.otp_inputs.last.input_value() == _OTP_DIGIT
+            if LoginPage._otp_auto_advance:
+                return
+        
+        # Fallback: fill each box directly; all() resolves the boxes once
+        for input_box in self.otp_inputs.all():
+            input_box.fill(_OTP_DIGIT)
+
+    def login_with_api(self, username: str, password: str):
+        """
+        Establish an authenticated session through the identity API, skipping the login UI.
+        
+        This method is intended for test setup where the goal is a logged-in
+        session rather than validating the login screens:
+        1. POST the credentials to the identity service login endpoint
+        2. Carry the resulting session over to the browser context
+        3. Open the application home page and wait for it to load
+        
+        Args:
+            username (str): The user's email address
+            password (str): The user's password
+            
+        Raises:
+            AssertionError: If the API returns a non-2xx status code, or if the
+                            application still shows the login screen afterwards
+            
+        Note:
+            The request is sent through page.request, which shares its cookie
+            jar with the browser context, so any Set-Cookie session from the API
+            is applied to the page automatically; such responses may have an
+            empty or non-JSON body. If the API instead returns a JSON body with
+            a token, it is stored as a cookie for HOME_URL.
+            Assumption: this endpoint issues a full session from email and
+            password alone. The UI flow adds an OTP step, and no API for it is
+            used here; if the environment requires it, open_home() fails fast
+            on the login screen and the UI login (--login-mode=ui) must be used.
+            Tests whose target is the login UI itself should keep using
+            login_with_otp().
+        """
+        # Authenticate against the identity service directly
+        # JSON body mirrors the fields of the login form
+        response = self.page.request.post(
+            f"{API_URL}{_API_LOGIN_PATH}",
+            data={"email": username, "password": password},
+        )
+        
+        # Assert that the API call was successful
+        # This ensures the test fails early if there are API issues
+        assert response.ok, f"Unexpected status: {response.status}, {response.text()}"
+        
+        # Store a token returned in a JSON body as the session cookie
+        # Cookies set by the response itself are already shared with the context,
+        # and cookie-only sessions may answer with an empty or non-JSON body
+        token = None
+        if "application/json" in response.headers.get("content-type", ""):
+            token = response.json().get("token")
+        if token:
+            self.page.context.add_cookies([{"name": _AUTH_COOKIE_NAME, "value": token, "url": HOME_URL}])
+        
+        # Open the application with the authenticated session
+        self.open_home()
+
+    def open_home(self):
+        """
+        Open the application home page with the context's existing session.
+        
+        Used after login_with_api() and for contexts restored from a saved
+        storage state, where no login form is shown.
+        
+        Raises:
+            AssertionError: If the login screen is shown instead, i.e. the
+                            session is missing or still needs OTP verification
+        """
+        # Same readiness signal as the UI login flow, but also stop as soon as
+        # the login form appears instead of waiting out the full 60s timeout
+        self.page.goto(HOME_URL, wait_until="commit")
+        self.home_text.or_(self.email_input).first.wait_for(timeout=60000)
+        assert not self.email_input.is_visible(), "Login screen shown: the session is not authenticated"
@@ -4,15 +4,94 @@
 # and teams management page of the Pemo application. It handles bulk user
 # invitation processes including CSV file generation, upload, and validation.
 
-import time
 import os
-import csv
+import re
 import random
 import string
-import tempfile
-from playwright.sync_api import Page
+from collections import deque
+from playwright.sync_api import Page, expect
+from config.environments import API_URL
+from pages.base_page import BasePage
 
-class MembersPage:
+# Selector Constants
+# ==================
+# Selector strings are defined once at module level; page-object instances
+# only bind references to them instead of rebuilding the literals per instance
+_MEMBERS_TEAMS_MENU = "//span[text()='Members & Teams']"
+_INVITE_BUTTON = "//button[@id='invite-btn']"
+_BULK_TAB_BUTTON = "//button[@id='tab-bulk']"
+_FILE_INPUT = "input[type='file']"
+_SEND_INVITES_BUTTON = "button:has-text('Send invites')"
+_SEARCH_INPUT = "//input[@id='members-search-input']"
+_ROLE_LABEL = "p.MuiTypography-body1"
+_INVITE_SENT_CHIP = "span.MuiChip-label:text-is('Invite sent')"
+
+# Member Role Matching
+# ====================
+# Exact text of the role labels shown in the members list
+_ROLE_TEXT = re.compile(r"^(Team Member|Admin|Accountant)$")
+
+# Random Email Pool
+# =================
+# Random invite addresses are pre-generated in batches and handed out once each,
+# so repeated bulk invites never reuse an address already invited this session
+EMAIL_NAME_LENGTH = 8        # Number of random lowercase letters per address
+EMAIL_DOMAIN = "example.com" # Domain used for all generated addresses
+EMAIL_POOL_BATCH = 1000      # Minimum number of addresses generated per refill
+_email_pool = deque()
+
+# Dedicated generator seeded once from the OS, plus the cached alphabet, so
+# refills neither share the global random state nor look up string.* each time
+_RNG = random.Random(os.urandom(16))
+_LETTERS = string.ascii_lowercase
+
+# Bulk Invite CSV
+# ===============
+BULK_CSV_NAME = "bulk_invite.csv"  # File name reported to the upload input
+BULK_CSV_MIME_TYPE = "text/csv"    # MIME type of the uploaded CSV
+
+def _take_random_emails(num_emails: int) -> list:
+    """
+    Take the requested number of unused random email addresses from the session pool.
+    
+    When the pool runs short it is refilled with one bulk random draw of
+    EMAIL_NAME_LENGTH letters per address, which is then sliced into names,
+    instead of drawing each address separately.
+    
+    Args:
+        num_emails (int): The number of email addresses to take
+        
+    Returns:
+        list: The email addresses, removed from the pool
+    """
+    shortfall = num_emails - len(_email_pool)
+    if shortfall > 0:
+        # One random draw covering the whole refill, sliced into fixed-length names
+        count = max(shortfall, EMAIL_POOL_BATCH)
+        letters = ''.join(_RNG.choices(_LETTERS, k=EMAIL_NAME_LENGTH * count))
+        _email_pool.extend(
+            f"{letters[i:i + EMAIL_NAME_LENGTH]}@{EMAIL_DOMAIN}"
+            for i in range(0, len(letters), EMAIL_NAME_LENGTH)
+        )
+    
+    return [_email_pool.popleft() for _ in range(num_emails)]
+
+def _is_api_post(response) -> bool:
+    """
+    Match responses to POST requests sent to the Pemo API.
+
+    Used to wait for the answer to the bulk invite submission, which is the
+    only API write the Send invites click triggers.
+
+    Args:
+        response (Response): A response observed by the page
+
+    Returns:
+        bool: True for responses to POST requests under API_URL
+    """
+    return response.request.method == "POST" and response.url.startswith(API_URL)
+
+class MembersPage(BasePage):
     """
     Page Object representing the members and teams management page of the Pemo application.
     
@@ -28,17 +107,25 @@ class MembersPage:
     
     Attributes:
         page (Page): The Playwright page object for browser interaction
-        members_teams_menu (str): XPath selector for members menu navigation
-        invite_button (str): XPath selector for invite button
-        bulk_tab_button (str): XPath selector for bulk invite tab
-        upload_csv_title (str): XPath selector for CSV upload area
-        file_input (str): CSS selector for file input element
-        send_invites_button (str): CSS selector for send invites button
-        search_input (str): XPath selector for member search input
-        role_label (str): XPath selector for member role display
-        invite_sent_chip (str): XPath selector for invite status indicator
+        members_teams_menu (Locator): Locator for members menu navigation
+        invite_button (Locator): Locator for invite button
+        bulk_tab_button (Locator): Locator for bulk invite tab
+        file_input (Locator): Locator for file input element
+        send_invites_button (Locator): Locator for send invites button
+        search_input (Locator): Locator for member search input
+        role_label (Locator): Locator for member role display
+        invite_sent_chip (Locator): Locator for invite status indicator
     """
     
+    # Instance attributes are fixed, so __slots__ drops the per-instance __dict__
+    __slots__ = (
+        "page",
+        "members_teams_menu",
+        "invite_button", "bulk_tab_button",
+        "file_input", "send_invites_button",
+        "search_input", "role_label", "invite_sent_chip",
+    )
+    
     def __init__(self, page: Page):
         """
         Initialize the MembersPage with a Playwright page object.
@@ -50,70 +137,91 @@ class MembersPage:
 
         # Page Element Locators
         # =====================
-        # These selectors identify the key elements on the members page
+        # These locators identify the key elements on the members page
+        # They are created once from the module-level selector constants so
+        # each action reuses the parsed selector
+        # .first keeps the non-strict "first match" behaviour of page.click(),
+        # page.fill() and page.set_input_files()
         # They are grouped by functionality for better organization
         
         # Navigation and Menu Elements
-        self.members_teams_menu = "//span[text()='Members & Teams']"  # Main navigation menu item
+        self.members_teams_menu = page.locator(_MEMBERS_TEAMS_MENU).first  # Main navigation menu item
         
         # Bulk Invite Interface Elements
-        self.invite_button = "//button[@id='invite-btn']"              # Invite button to open invite modal
-        self.bulk_tab_button = "//button[@id='tab-bulk']"              # Bulk invite tab selection
-        self.upload_csv_title = "//p[@title='Upload CSV file']"        # CSV upload area trigger
-        self.file_input = "input[type='file']"                         # File input element for CSV upload
-        self.send_invites_button = "button:has-text('Send invites')"   # Submit button for bulk invites
+        self.invite_button = page.locator(_INVITE_BUTTON).first              # Invite button to open invite modal
+        self.bulk_tab_button = page.locator(_BULK_TAB_BUTTON).first          # Bulk invite tab selection
+        self.file_input = page.locator(_FILE_INPUT).first                    # File input element for CSV upload
+        self.send_invites_button = page.locator(_SEND_INVITES_BUTTON).first  # Submit button for bulk invites
         
         # Member Management and Search Elements
-        self.search_input = "//input[@id='members-search-input']"      # Member search input field
-        self.role_label = (
-            "//p[contains(@class, 'MuiTypography-body1') and "
-            "(text()='Team Member' or text()='Admin' or text()='Accountant')]"
-        )  # Member role display element
-        self.invite_sent_chip = (
-            "//span[contains(@class, 'MuiChip-label') and text()='Invite sent']"
-        )  # Invite status indicator
+        self.search_input = page.locator(_SEARCH_INPUT).first  # Member search input field
+        # Role and status locators use native CSS class selection plus text
+        # matching instead of XPath string comparisons, which are slow to poll
+        self.role_label = page.locator(_ROLE_LABEL).filter(has_text=_ROLE_TEXT)  # Member role display element
+        self.invite_sent_chip = page.locator(_INVITE_SENT_CHIP)                  # Invite status indicator
 
     def navigate(self):
         """
         Navigate to the Members & Teams section of the application.
         
-        This method waits for the members menu to be available and clicks
-        it to access the team management functionality. It includes appropriate
-        waits to ensure reliable navigation.
+        This method clicks the members menu as soon as it is available to
+        access the team management functionality. The click auto-waits for
+        the menu to be actionable to ensure reliable navigation.
         
         Note:
             The method waits up to 20 seconds for the menu to be available,
             accounting for potential page load delays in the application.
         """
-        # Wait for the Members & Teams menu item to be available
-        # Extended timeout (20s) accounts for potential page load delays
-        self.page.wait_for_selector(self.members_teams_menu, timeout=20000)
-        
         # Click the menu item to navigate to the members section
-        self.page.click(self.members_teams_menu)
+        # click() auto-waits for the menu item to be actionable
+        # Extended timeout (20s) accounts for potential page load delays
+        self.members_teams_menu.click(timeout=20000)
 
     def open_bulk_invite(self):
         """
         Open the bulk invite interface for inviting multiple team members.
         
         This method performs the following steps:
-        1. Waits for the invite button to be available
-        2. Clicks the invite button to open the invite modal
-        3. Switches to the bulk invite tab for CSV-based invitations
+        1. Clicks the invite button to open the invite modal
+        2. Switches to the bulk invite tab for CSV-based invitations
         
         Note:
-            The method includes appropriate waits between actions to ensure
+            Each click auto-waits for its element to be actionable to ensure
             reliable interaction with the dynamic interface elements.
         """
-        # Wait for the invite button to be available and click it
+        # Click the invite button as soon as it is available
         # Extended timeout (20s) accounts for potential page load delays
-        self.page.wait_for_selector(self.invite_button, timeout=20000)
-        self.page.click(self.invite_button)
+        self.invite_button.click(timeout=20000)
 
-        # Wait for the bulk invite tab to be available and click it
+        # Click the bulk invite tab as soon as it is available
         # This switches the interface to CSV-based bulk invitation mode
-        self.page.wait_for_selector(self.bulk_tab_button, timeout=20000)
-        self.page.click(self.bulk_tab_button)
+        self.bulk_tab_button.click(timeout=20000)
+
+    def generate_bulk_csv(self, num_emails: int):
+        """
+        Generate random email addresses and the bulk-invite CSV content for them.
+        
+        Args:
+            num_emails (int): The number of random email addresses to generate
+            
+        Returns:
+            tuple: (csv_bytes, emails) where csv_bytes is the UTF-8 encoded CSV
+                   with an "emails" header column and emails is the list of
+                   generated addresses in file order
+                   
+        Note:
+            The method takes realistic-looking email addresses of random
+            lowercase letters from a pre-generated pool; each address is used
+            only once per session. The CSV format matches the application's expected
+            structure with an "emails" header column.
+        """
+        # Take unused random email addresses from the session pool
+        random_emails = _take_random_emails(num_emails)
+
+        # Build the CSV in memory in a single join
+        # Addresses contain only [a-z], "@" and ".", so no CSV quoting is needed
+        csv_text = "emails\n" + "\n".join(random_emails) + "\n"  # "emails" header column
+        return csv_text.encode(), random_emails
 
     def generate_random_emails(self, num_emails: int, file_path: str):
         """
@@ -121,9 +229,8 @@ class MembersPage:
         
         This method creates test data for bulk invitation testing:
         1. Generates the specified number of random email addresses
-        2. Creates a CSV file with the proper header structure
-        3. Writes the email addresses to the CSV file
-        4. Returns the first two emails for validation purposes
+        2. Writes them to the CSV file with the proper header structure
+        3. Returns the first two emails for validation purposes
         
         Args:
             num_emails (int): The number of random email addresses to generate
@@ -134,26 +241,15 @@ class MembersPage:
                    (email_1, email_2) for validation purposes
                    
         Note:
-            The method generates realistic-looking email addresses using random
-            lowercase letters. The CSV format matches the application's expected
-            structure with an "emails" header column.
+            upload_bulk_csv() does not use this method; it uploads the content
+            from generate_bulk_csv() straight from memory. Use this when a CSV
+            file on disk is needed, e.g. for a manual upload.
         """
-        # Generate random email addresses for testing
-        random_emails = []
-        for _ in range(num_emails):
-            # Create a random 8-character name using lowercase letters
-            name = ''.join(random.choices(string.ascii_lowercase, k=8))
-            # Construct email address using the random name
-            email = f"{name}@example.com"
-            random_emails.append(email)
-
-        # Write the generated emails to a CSV file
-        # The file structure matches the application's expected format
-        with open(file_path, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["emails"])  # CSV header column
-            for email in random_emails:
-                writer.writerow([email])
+        csv_bytes, random_emails = self.generate_bulk_csv(num_emails)
+
+        # Write the generated CSV to the file in a single write
+        with open(file_path, "wb") as f:
+            f.write(csv_bytes)
 
         # Return the first two emails for validation purposes
         # This allows tests to verify the invitation process
@@ -164,89 +260,111 @@ class MembersPage:
         Upload a CSV file containing email addresses for bulk invitation.
         
         This method performs the complete bulk invitation process:
-        1. Waits for the CSV upload interface to be ready
-        2. Generates a temporary CSV file with test email addresses
-        3. Uploads the CSV file to the application
-        4. Submits the bulk invitation request
-        5. Returns the generated email addresses for validation
+        1. Generates CSV content with test email addresses in memory
+        2. Uploads it directly to the file input element
+        3. Submits the bulk invitation request and waits for the API to answer it
+        4. Returns the generated email addresses for validation
         
         Returns:
             tuple: A tuple containing the first two generated email addresses
                    (email_1, email_2) for validation purposes
                    
+        Raises:
+            AssertionError: If the invite request returns a non-2xx status code
+                   
         Note:
-            The method creates a temporary CSV file in the system's temp directory
-            and generates 2 test email addresses. The file is automatically
-            cleaned up by the system after the test completes.
+            The CSV is passed to the browser as an in-memory buffer, so no
+            temporary file is written, shared between parallel workers or
+            cleaned up afterwards. The emails are fresh on every call.
+            The upload area is not clicked: set_input_files() works on the
+            file input directly, so no native file picker is ever opened.
         """
-        # Wait for the CSV upload interface to be ready
-        # Extended timeout (20s) accounts for potential interface loading delays
-        self.page.wait_for_selector(self.upload_csv_title, timeout=20000)
-        self.page.click(self.upload_csv_title)
+        # Generate 2 test email addresses and the CSV content for them
+        csv_bytes, random_emails = self.generate_bulk_csv(2)
 
-        # Create a temporary CSV file with test email addresses
-        # Use the system's temporary directory for proper cleanup
-        tmp_dir = tempfile.gettempdir()
-        csv_path = os.path.join(tmp_dir, "bulk_invite.csv")
+        # Upload the generated CSV content to the application as a file payload
+        # set_input_files() auto-waits for the input to be attached; the
+        # extended timeout (20s) accounts for interface loading delays
+        self.file_input.set_input_files(
+            files=[{"name": BULK_CSV_NAME, "mimeType": BULK_CSV_MIME_TYPE, "buffer": csv_bytes}],
+            timeout=20000,
+        )
         
-        # Generate 2 test email addresses and save them to the CSV file
-        email_1, email_2 = self.generate_random_emails(2, csv_path)
-
-        # Upload the generated CSV file to the application
-        self.page.set_input_files(self.file_input, csv_path)
-        
-        # Submit the bulk invitation request
-        self.page.click(self.send_invites_button)
+        # Submit the bulk invitation request and wait for the API's answer
+        # The invites exist once the server has responded, so a later reload
+        # neither aborts the request nor lists the members before they exist
+        # Extended timeout (30s) accounts for backend processing time
+        with self.page.expect_response(_is_api_post, timeout=30000) as invite_response:
+            self.send_invites_button.click()
+        response = invite_response.value
+        assert response.ok, f"Unexpected invite status: {response.status}, {response.url}"
 
         # Return the generated email addresses for validation purposes
-        return email_1, email_2
+        return random_emails[0], random_emails[1]
 
     def search_and_assert_member(self, email_to_search: str, role_to_assert: str):
         """
         Search for a specific member and validate their role and invitation status.
         
+        This is the single-email form of search_and_assert_members().
+        
+        Args:
+            email_to_search (str): The email address to search for
+            role_to_assert (str): The expected role for the member
+                                 (e.g., "Team Member", "Admin", "Accountant")
+        """
+        self.search_and_assert_members([email_to_search], role_to_assert)
+
+    def search_and_assert_members(self, emails_to_search, role_to_assert: str):
+        """
+        Search for several members and validate their role and invitation status.
+        
         This method performs comprehensive validation of the invitation process:
-        1. Waits for the invitation processing to complete
-        2. Reloads the page to ensure fresh data
-        3. Searches for the specific email address
+        1. Reloads the page once to list the newly invited members
+        2. Searches for each email address in turn
+        3. Waits until the search has applied: the email is listed and it is
+           the only invited member shown
         4. Validates the member's assigned role
         5. Confirms the invitation status is "Invite sent"
         
         Args:
-            email_to_search (str): The email address to search for
-            role_to_assert (str): The expected role for the member
+            emails_to_search (list): The email addresses to search for
+            role_to_assert (str): The expected role for every member
                                  (e.g., "Team Member", "Admin", "Accountant")
                                  
         Note:
-            The method includes appropriate waits and timeouts to ensure
-            reliable validation. It uses assertions to verify both role
-            and invitation status, ensuring the complete invitation flow
-            was successful.
+            The page is reloaded only once for the whole batch, since a single
+            reload already shows every member invited before the call;
+            upload_bulk_csv() returns only once the invite request has been
+            answered. The method relies on polling expect() assertions rather
+            than fixed sleeps or network idle to ensure reliable validation. The role and status checks only run once the list shows the
+            searched email and a single "Invite sent" chip. The addresses are
+            unique, so at that point the one listed member is the searched
+            one; a stale result from the previous search or another member
+            can never satisfy them. No row markup is assumed.
         """
-        # Wait for invitation processing to complete
-        # 10-second wait accounts for backend processing time
-        time.sleep(10)
-        
         # Reload the page to ensure fresh data is displayed
-        # This is necessary to see the newly invited members
+        # This is necessary to see the newly invited members; the search
+        # input fill below auto-waits for the reloaded page
         self.page.reload()
 
-        # Search for the specific email address
-        self.page.fill(self.search_input, email_to_search)
-        
-        # Wait for search results to load
-        # 5-second wait accounts for search processing time
-        time.sleep(5)
+        for email_to_search in emails_to_search:
+            # Search for the specific email address
+            self.search_input.fill(email_to_search)
 
-        # Validate the member's assigned role
-        # Wait for the role label to be visible and verify the expected role
-        self.page.wait_for_selector(self.role_label, timeout=20000)
-        assert role_to_assert in self.page.inner_text(self.role_label)
+            # Wait until the search has applied
+            # The email must be listed (the search box value itself is not
+            # matched by get_by_text()) and be the only invited member shown;
+            # before that, the unfiltered list shows several invite chips
+            expect(self.page.get_by_text(email_to_search).first).to_be_visible(timeout=20000)
+            expect(self.invite_sent_chip).to_have_count(1, timeout=20000)
 
-        # Confirm the invitation status is "Invite sent"
-        # Wait for the status chip to be visible and verify the status
-        self.page.wait_for_selector(self.invite_sent_chip, timeout=20000)
-        assert "Invite sent" in self.page.inner_text(self.invite_sent_chip)
+            # Validate the member's assigned role
+            # expect() polls until the search results show the expected role,
+            # returning as soon as the DOM reaches that state (20s timeout)
+            # .first keeps the non-strict "first match" behaviour of page.inner_text()
+            expect(self.role_label.first).to_contain_text(role_to_assert, timeout=20000)
 
-        # Brief wait to ensure all UI updates are complete
-        time.sleep(2)
+            # Confirm the invitation status is "Invite sent"
+            # Same polling assertion on the single listed status chip
+            expect(self.invite_sent_chip).to_contain_text("Invite sent", timeout=20000)
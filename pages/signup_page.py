@@ -4,9 +4,31 @@
 # of the Pemo application. It handles the complete user registration flow including
 # form filling, reCAPTCHA handling, and form submission.
 
+import logging
+from typing import Optional
+from playwright.sync_api import Page
 from utils.data_utils import DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_PASSWORD
+from utils.form_utils import set_input_values
+from pages.base_page import BasePage
 
-class SignupPage:
+log = logging.getLogger(__name__)
+
+# Selector Constants
+# ==================
+# Selector strings are defined once at module level; page-object instances
+# only bind references to them instead of rebuilding the literals per instance
+_RECAPTCHA_IFRAME = "iframe[title='reCAPTCHA']"
+_RECAPTCHA_ANCHOR = "#recaptcha-anchor"
+_EMAIL_INPUT = "xpath=(//input[@id='signUp-1-1'])[1]"
+_FIRST_NAME_INPUT = "input[name='firstName']"
+_LAST_NAME_INPUT = "input[name='lastName']"
+_PASSWORD_INPUT = "input[name='password']"
+_REPEAT_PASSWORD_INPUT = "input[name='repeatPassword']"
+_SOURCE_COMBOBOX = "//div[contains(@class, 'MuiSelect-outlined') and @role='combobox']"
+_SOURCE_SOCIAL_MEDIA = "//li[normalize-space()='Social Media']"
+_GET_STARTED_BUTTON = "button#get-started-submit-btn"
+
+class SignupPage(BasePage):
     """
     Page Object representing the user signup/registration page of the Pemo application.
     
@@ -20,50 +42,67 @@ class SignupPage:
     and implements the Page Object Model pattern for maintainable test code.
     
     Attributes:
-        page: The Playwright page object for browser interaction
-        recaptcha_iframe (str): Selector for reCAPTCHA iframe
-        recaptcha_anchor (str): Selector for reCAPTCHA checkbox
-        email_input (str): XPath selector for email input field
-        first_name_input (str): CSS selector for first name input
-        last_name_input (str): CSS selector for last name input
-        password_input (str): CSS selector for password input
-        repeat_password_input (str): CSS selector for password confirmation
-        source_combobox (str): XPath selector for source selection dropdown
-        source_social_media (str): XPath selector for social media option
-        get_started_button (str): CSS selector for form submission button
+        page (Page): The Playwright page object for browser interaction
+        recaptcha_iframe (Locator): Locator for reCAPTCHA iframe
+        recaptcha_anchor (Locator): Locator for reCAPTCHA checkbox inside the iframe
+        email_input (Locator): Locator for email input field
+        first_name_input (Locator): Locator for first name input
+        last_name_input (Locator): Locator for last name input
+        password_input (Locator): Locator for password input
+        repeat_password_input (Locator): Locator for password confirmation
+        source_combobox (Locator): Locator for source selection dropdown
+        source_social_media (Locator): Locator for social media option
+        get_started_button (Locator): Locator for form submission button
     """
     
-    def __init__(self, page):
+    # Instance attributes are fixed, so __slots__ drops the per-instance __dict__
+    __slots__ = (
+        "page",
+        "recaptcha_iframe", "recaptcha_anchor",
+        "email_input", "first_name_input", "last_name_input",
+        "password_input", "repeat_password_input",
+        "source_combobox", "source_social_media",
+        "get_started_button",
+    )
+    
+    # Whether the signup form embeds reCAPTCHA in this environment
+    # None until probed by the first signup in this process
+    _recaptcha_present: Optional[bool] = None
+    
+    def __init__(self, page: Page):
         """
         Initialize the SignupPage with a Playwright page object.
         
         Args:
-            page: The Playwright page object for browser automation
+            page (Page): The Playwright page object for browser automation
         """
         self.page = page
 
         # Page Element Locators
         # =====================
-        # These selectors identify the key elements on the signup page
+        # These locators identify the key elements on the signup page
+        # They are created once from the module-level selector constants so
+        # each action reuses the parsed selector
+        # .first keeps the non-strict "first match" behaviour of page.click() and page.fill()
         # They are grouped by functionality for better organization
         
         # reCAPTCHA Elements
-        self.recaptcha_iframe = "iframe[title='reCAPTCHA']"        # reCAPTCHA iframe container
-        self.recaptcha_anchor = "#recaptcha-anchor"                 # reCAPTCHA checkbox element
+        self.recaptcha_iframe = page.locator(_RECAPTCHA_IFRAME)                                   # reCAPTCHA iframe container
+        self.recaptcha_anchor = page.frame_locator(_RECAPTCHA_IFRAME).locator(_RECAPTCHA_ANCHOR)  # reCAPTCHA checkbox element
         
         # User Information Form Fields
-        self.email_input = "xpath=(//input[@id='signUp-1-1'])[1]"  # Email address input
-        self.first_name_input = "input[name='firstName']"           # First name input field
-        self.last_name_input = "input[name='lastName']"             # Last name input field
-        self.password_input = "input[name='password']"              # Password input field
-        self.repeat_password_input = "input[name='repeatPassword']" # Password confirmation field
+        self.email_input = page.locator(_EMAIL_INPUT)                            # Email address input
+        self.first_name_input = page.locator(_FIRST_NAME_INPUT).first            # First name input field
+        self.last_name_input = page.locator(_LAST_NAME_INPUT).first              # Last name input field
+        self.password_input = page.locator(_PASSWORD_INPUT).first                # Password input field
+        self.repeat_password_input = page.locator(_REPEAT_PASSWORD_INPUT).first  # Password confirmation field
         
         # User Source Selection
-        self.source_combobox = "//div[contains(@class, 'MuiSelect-outlined') and @role='combobox']"  # Source dropdown
-        self.source_social_media = "//li[normalize-space()='Social Media']"                         # Social media option
+        self.source_combobox = page.locator(_SOURCE_COMBOBOX)          # Source dropdown
+        self.source_social_media = page.locator(_SOURCE_SOCIAL_MEDIA)  # Social media option
         
         # Form Submission
-        self.get_started_button = "button#get-started-submit-btn"   # Submit button to complete registration
+        self.get_started_button = page.locator(_GET_STARTED_BUTTON).first  # Submit button to complete registration
 
     def fill_signup_form(self, email: str):
         """
@@ -81,45 +120,64 @@ class SignupPage:
                         
         Note:
             The method uses default test data for first name, last name, and password
-            to ensure consistency across test runs. The reCAPTCHA handling includes
-            a try-catch block to gracefully handle cases where reCAPTCHA is not
-            present or cannot be interacted with during testing.
+            to ensure consistency across test runs. reCAPTCHA presence is detected
+            once per process, after the page's load event, and cached; when present,
+            a try-catch block gracefully handles cases where it cannot be interacted
+            with during testing.
         """
         # reCAPTCHA Handling
         # ===================
-        # Attempt to handle reCAPTCHA verification if present
-        # This is wrapped in a try-catch to handle cases where reCAPTCHA
-        # is not present or cannot be interacted with during testing
-        try:
-            # Locate the reCAPTCHA iframe and click the checkbox
-            frame = self.page.frame_locator(self.recaptcha_iframe)
-            frame.locator(self.recaptcha_anchor).click(timeout=5000)
-            
-            # Wait briefly for reCAPTCHA verification to complete
-            self.page.wait_for_timeout(1000)
-        except Exception:
-            # Log warning and continue if reCAPTCHA cannot be handled
+        # Detect reCAPTCHA once per process and cache the result (present or
+        # not), so environments without reCAPTCHA (the common CI case) never
+        # pay a probe or click timeout on subsequent signups. The signup page
+        # is opened with wait_until="commit", so the probe first waits for the
+        # page's load event: Google's script is loaded by then and has had its
+        # chance to inject the iframe, so a miss is a real miss.
+        if SignupPage._recaptcha_present is None:
+            self.page.wait_for_load_state("load")
+            SignupPage._recaptcha_present = self.recaptcha_iframe.count() > 0
+
+        if SignupPage._recaptcha_present:
+            # Attempt to handle reCAPTCHA verification
+            # This is wrapped in a try-catch to handle cases where reCAPTCHA
+            # cannot be interacted with during testing
+            try:
+                # Click the checkbox inside the reCAPTCHA iframe
+                self.recaptcha_anchor.click(timeout=2000)
+                
+                # Wait briefly for reCAPTCHA verification to complete
+                self.page.wait_for_timeout(1000)
+            except Exception:
+                # Log warning and continue if reCAPTCHA cannot be handled
+                log.warning("reCAPTCHA present but could not be completed; skipped")
+        else:
+            # Log and continue if reCAPTCHA is not present
             # This allows tests to proceed even if reCAPTCHA is not present
-            print("⚠️ reCAPTCHA skipped")
+            log.debug("reCAPTCHA not present; skipped")
 
         # Form Field Population
         # =====================
         # Fill in all required form fields with appropriate test data
-        self.page.fill(self.email_input, email)                    # User-provided email
-        self.page.fill(self.first_name_input, DEFAULT_FIRST_NAME)  # Default first name
-        self.page.fill(self.last_name_input, DEFAULT_LAST_NAME)    # Default last name
-        self.page.fill(self.password_input, DEFAULT_PASSWORD)      # Default strong password
-        self.page.fill(self.repeat_password_input, DEFAULT_PASSWORD)  # Password confirmation
+        # The email keeps a real fill() so its async validation sees typed input
+        self.email_input.fill(email)  # User-provided email
+
+        # The remaining plain text fields are set in a single browser call
+        set_input_values(self.first_name_input, {
+            _FIRST_NAME_INPUT: DEFAULT_FIRST_NAME,    # Default first name
+            _LAST_NAME_INPUT: DEFAULT_LAST_NAME,      # Default last name
+            _PASSWORD_INPUT: DEFAULT_PASSWORD,        # Default strong password
+            _REPEAT_PASSWORD_INPUT: DEFAULT_PASSWORD, # Password confirmation
+        })
 
         # User Source Selection
         # =====================
         # Open the source dropdown and select "Social Media" as the user source
         # This simulates how users typically discover the application
-        self.page.locator(self.source_combobox).click()
-        self.page.locator(self.source_social_media).click()
+        self.source_combobox.click()
+        self.source_social_media.click()
 
         # Form Submission
         # ===============
         # Click the submit button to complete the registration process
         # This will trigger the email verification flow
-        self.page.click(self.get_started_button)
+        self.get_started_button.click()
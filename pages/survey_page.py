@@ -4,7 +4,26 @@
 # survey/preferences page of the Pemo application. It handles the final
 # step of user onboarding where users select their team and role preferences.
 
-class SurveyPage:
+from playwright.sync_api import Page
+from pages.base_page import BasePage
+
+# Selector Constants
+# ==================
+# Selector strings are defined once at module level; page-object instances
+# only bind references to them instead of rebuilding the literals per instance
+_SAVE_BUTTON = "(//button[normalize-space()='Save'])[1]"
+_GET_STARTED_TEXT = "text=Get started"
+
+# Accessible Names
+# ================
+# Labels and option names resolved through Playwright's accessibility queries
+# (get_by_label / get_by_role) instead of XPath contains()/following-sibling walks
+_TEAM_DROPDOWN_LABEL = "Select a team"
+_TEAM_OPTION_ENGINEERING_NAME = "Engineering / IT"
+_ROLE_DROPDOWN_LABEL = "Select a role"
+_ROLE_OPTION_MANAGER_NAME = "Manager"
+
+class SurveyPage(BasePage):
     """
     Page Object representing the user survey/preferences page of the Pemo application.
     
@@ -17,40 +36,58 @@ class SurveyPage:
     customize the user experience based on their role and team context.
     
     Attributes:
-        page: The Playwright page object for browser interaction
-        team_dropdown (str): XPath selector for team selection dropdown
-        team_option_engineering (str): XPath selector for Engineering/IT team option
-        role_dropdown (str): XPath selector for role selection dropdown
-        role_option_manager (str): XPath selector for Manager role option
-        save_button (str): XPath selector for save preferences button
-        get_started_text (str): Text selector indicating successful completion
+        page (Page): The Playwright page object for browser interaction
+        team_dropdown (Locator): Locator for team selection dropdown
+        team_option_engineering (Locator): Locator for Engineering/IT team option
+        role_dropdown (Locator): Locator for role selection dropdown
+        role_option_manager (Locator): Locator for Manager role option
+        save_button (Locator): Locator for save preferences button
+        get_started_text (Locator): Locator for text indicating successful completion
     """
     
-    def __init__(self, page):
+    # Instance attributes are fixed, so __slots__ drops the per-instance __dict__
+    __slots__ = (
+        "page",
+        "team_dropdown", "team_option_engineering",
+        "role_dropdown", "role_option_manager",
+        "save_button", "get_started_text",
+    )
+    
+    def __init__(self, page: Page):
         """
         Initialize the SurveyPage with a Playwright page object.
         
         Args:
-            page: The Playwright page object for browser automation
+            page (Page): The Playwright page object for browser automation
         """
         self.page = page
 
         # Page Element Locators
         # =====================
-        # These selectors identify the key elements on the survey page
+        # These locators identify the key elements on the survey page
+        # They are created once from the module-level selector constants so
+        # each action reuses the parsed selector
+        # .first keeps the non-strict "first match" behaviour of page.click()
+        # and page.wait_for_selector()
         # They are grouped by functionality for better organization
         
         # Team Selection Elements
-        self.team_dropdown = "//label[contains(text(), 'Select a team')]/following-sibling::div//div[@role='combobox']"  # Team dropdown trigger
-        self.team_option_engineering = "//li[@role='option' and @data-value='Engineering / IT']"                           # Engineering team option
+        # The comboboxes are found by their label and the options by role and
+        # exact name, so the page's accessibility mapping does the matching
+        self.team_dropdown = page.get_by_label(_TEAM_DROPDOWN_LABEL).first  # Team dropdown trigger
+        self.team_option_engineering = page.get_by_role(
+            "option", name=_TEAM_OPTION_ENGINEERING_NAME, exact=True
+        ).first  # Engineering team option
         
         # Role Selection Elements
-        self.role_dropdown = "//label[contains(text(), 'Select a role')]/following-sibling::div//div[@role='combobox']"  # Role dropdown trigger
-        self.role_option_manager = "//li[text()='Manager']"                                                              # Manager role option
+        self.role_dropdown = page.get_by_label(_ROLE_DROPDOWN_LABEL).first  # Role dropdown trigger
+        self.role_option_manager = page.get_by_role(
+            "option", name=_ROLE_OPTION_MANAGER_NAME, exact=True
+        ).first  # Manager role option
         
         # Form Completion Elements
-        self.save_button = "(//button[normalize-space()='Save'])[1]"                                                      # Save preferences button
-        self.get_started_text = "text=Get started"                                                                       # Success indicator text
+        self.save_button = page.locator(_SAVE_BUTTON)                  # Save preferences button
+        self.get_started_text = page.locator(_GET_STARTED_TEXT).first  # Success indicator text
 
     def fill_survey(self):
         """
@@ -74,23 +111,23 @@ class SurveyPage:
         # ===============
         # Open the team dropdown and select the Engineering/IT option
         # This simulates a user choosing their primary team
-        self.page.click(self.team_dropdown)
-        self.page.click(self.team_option_engineering)
+        self.team_dropdown.click()
+        self.team_option_engineering.click()
 
         # Role Selection
         # ===============
         # Open the role dropdown and select the Manager option
         # This simulates a user defining their position within the team
-        self.page.click(self.role_dropdown)
-        self.page.click(self.role_option_manager)
+        self.role_dropdown.click()
+        self.role_option_manager.click()
 
         # Save Preferences and Complete Onboarding
         # =======================================
         # Click the save button to submit the survey preferences
         # This completes the user onboarding process
-        self.page.click(self.save_button)
+        self.save_button.click()
         
         # Wait for the "Get started" text to appear, indicating successful
         # survey completion and transition to the main dashboard
         # Extended timeout (20s) accounts for potential processing delays
-        self.page.wait_for_selector(self.get_started_text, timeout=20000)
+        self.get_started_text.wait_for(timeout=20000)
@@ -0,0 +1,318 @@
+# Pytest Shared Fixtures Module
+# =============================
+# This module holds the command-line options and fixtures shared by the
+# test modules of the Pemo application test suite.
+#
+# Options:
+# --login-mode: How tests that only need an authenticated session log in
+#               ("ui" drives the login screens, "api" reuses one identity API
+#               login per worker through a saved storage state)
+#
+# Browser Fixtures:
+# One Chromium process is kept in a session-wide pool and every test gets a
+# fresh browser context (cookies, cache and storage reset) and page on top
+# of it. The pool relaunches the browser after BROWSER_POOL_RECYCLE_AFTER
+# contexts to bound native memory growth. Under pytest-xdist every worker is
+# its own process with its own session, so each worker owns exactly one
+# pooled browser and tests on different workers never share a browser.
+# Launch and context settings use
+# pytest-playwright's browser_type_launch_args / browser_context_args hooks,
+# and the page fixture comes from pytest-playwright on top of our context.
+#
+# Failure Screenshots:
+# A screenshot is saved as fail_<test name>.png only when a test's setup or
+# body fails, so passing runs never pay for capturing and encoding a PNG.
+# The fixtures that open browser contexts record them on the test item, so
+# pages created inside a fixture that then fails (e.g. a failed admin login)
+# are captured as well.
+
+import logging
+import os
+import pytest
+from pages.login_page import LoginPage
+from utils.network_utils import block_nonessential_requests
+
+log = logging.getLogger(__name__)
+
+# Set HEADED=1 to watch the browser while debugging (same as --headed)
+HEADED = os.environ.get("HEADED") == "1"
+
+# Fixed viewport used for every test context
+VIEWPORT = {"width": 1280, "height": 720}
+
+# Admin account used by tests that need an authenticated session
+ADMIN_EMAIL = "admin@autotest.io"
+ADMIN_PASSWORD = "Admin@123"
+
+# Number of contexts served by one browser process before it is relaunched
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("BROWSER_POOL_RECYCLE_AFTER", "100"))
+
+
+class BrowserPool:
+    """
+    Session-wide holder of the shared browser process.
+
+    The browser is launched lazily on the first context request and replaced
+    by a fresh launch once it has served recycle_after contexts. Tests run
+    one at a time per process, so the previous context is always closed
+    before the browser is recycled.
+    """
+
+    def __init__(self, browser_type, launch_args: dict, recycle_after: int):
+        """
+        Initialize the pool without launching a browser yet.
+
+        Args:
+            browser_type (BrowserType): The Playwright browser type to launch
+            launch_args (dict): Arguments passed to browser_type.launch()
+            recycle_after (int): Contexts served before the browser is relaunched
+        """
+        self._browser_type = browser_type
+        self._launch_args = launch_args
+        self._recycle_after = recycle_after
+        self._browser = None
+        self._contexts_served = 0
+
+    def new_context(self, **context_args):
+        """
+        Create a new browser context, launching or recycling the browser as needed.
+
+        Args:
+            **context_args: Arguments passed to browser.new_context()
+
+        Returns:
+            BrowserContext: A fresh, isolated context on the shared browser
+        """
+        if self._browser is None or self._contexts_served >= self._recycle_after:
+            self.close()
+            self._browser = self._browser_type.launch(**self._launch_args)
+            self._contexts_served = 0
+        self._contexts_served += 1
+        return self._browser.new_context(**context_args)
+
+    def close(self):
+        """Close the current browser process, if one is running."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+
+
+def pytest_addoption(parser):
+    """
+    Register the custom command-line options of the test suite.
+
+    Args:
+        parser: The pytest command-line parser
+    """
+    parser.addoption(
+        "--login-mode",
+        action="store",
+        default="ui",
+        choices=("ui", "api"),
+        help="Log in through the UI with OTP (default) or directly through the identity API",
+    )
+
+
+# Browser contexts opened for the current test, read by the screenshot hook
+_TEST_CONTEXTS = pytest.StashKey[list]()
+
+
+def _track_context(request, context):
+    """
+    Record a browser context on the test item for failure screenshots.
+
+    Call this right after creating the context, before anything that can
+    fail, so a failure later in the same fixture is still captured.
+
+    Args:
+        request: The pytest fixture request of the test
+        context (BrowserContext): The context just created for the test
+    """
+    request.node.stash.setdefault(_TEST_CONTEXTS, []).append(context)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Save a screenshot of the test's pages when its setup or body fails.
+
+    Every page of the contexts recorded with _track_context() is captured,
+    so a failure inside a fixture such as admin_page is covered even though
+    that fixture never reaches item.funcargs. Teardown failures are skipped
+    because the pages are already closed by then.
+
+    Args:
+        item: The test item being reported
+        call: Information about the setup, call or teardown phase
+
+    Note:
+        A page that crashed or was closed cannot be captured; the error is
+        logged and the original test failure is reported unchanged.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if not report.failed or report.when == "teardown":
+        return
+    pages = [page for context in item.stash.get(_TEST_CONTEXTS, []) for page in context.pages]
+    for index, page in enumerate(pages):
+        suffix = f"_{index + 1}" if len(pages) > 1 else ""
+        path = f"fail_{item.name}{suffix}.png"
+        try:
+            page.screenshot(path=path)
+        except Exception as error:
+            log.warning("Could not save failure screenshot %s: %s", path, error)
+
+
+@pytest.fixture
+def login_mode(request) -> str:
+    """
+    Return the login mode selected with --login-mode.
+
+    Tests whose target is not the login flow itself use this to choose between
+    LoginPage.login_with_otp() and the faster LoginPage.login_with_api().
+
+    Returns:
+        str: Either "ui" or "api"
+    """
+    return request.config.getoption("--login-mode")
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    """
+    Configure the single session-wide browser launch.
+
+    The browser runs headless by default, which skips window compositing
+    and GPU raster work on every action. HEADED=1 (or pytest-playwright's
+    --headed flag) shows the browser for local debugging.
+
+    Args:
+        browser_type_launch_args (dict): Defaults provided by pytest-playwright
+
+    Returns:
+        dict: Launch arguments passed to browser_type.launch()
+    """
+    if HEADED:
+        return {**browser_type_launch_args, "headless": False}
+    return browser_type_launch_args
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args):
+    """
+    Configure the browser context created for each test.
+
+    Contexts use a fixed viewport, so layout and element visibility are the
+    same in headless and headed runs without a maximized window.
+
+    Args:
+        browser_context_args (dict): Defaults provided by pytest-playwright
+
+    Returns:
+        dict: Arguments passed to browser.new_context()
+    """
+    return {**browser_context_args, "viewport": VIEWPORT}
+
+
+@pytest.fixture(scope="session")
+def browser_pool(browser_type, browser_type_launch_args):
+    """
+    Provide the session-wide browser pool.
+
+    Args:
+        browser_type (BrowserType): Browser type selected by pytest-playwright (--browser)
+        browser_type_launch_args (dict): Launch arguments configured above
+
+    Yields:
+        BrowserPool: The pool; its browser is closed at the end of the session
+    """
+    pool = BrowserPool(browser_type, browser_type_launch_args, BROWSER_POOL_RECYCLE_AFTER)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def context(request, browser_pool, browser_context_args):
+    """
+    Provide a fresh browser context from the pool for each test.
+
+    Third-party analytics, image and font requests are aborted before the
+    test opens any page, so page loads only wait for what the tests need.
+    pytest-playwright's page fixture opens its page on this context.
+
+    Args:
+        request: The pytest fixture request
+        browser_pool (BrowserPool): The session-wide browser pool
+        browser_context_args (dict): Context arguments configured above
+
+    Yields:
+        BrowserContext: The context, closed again after the test
+    """
+    context = browser_pool.new_context(**browser_context_args)
+    _track_context(request, context)
+    block_nonessential_requests(context)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def admin_storage_state(browser_pool, browser_context_args, tmp_path_factory) -> str:
+    """
+    Log the admin in through the identity API once and save the session.
+
+    The cookies and localStorage of the logged-in context are written with
+    context.storage_state(), so every later admin context starts already
+    authenticated. Under pytest-xdist each worker logs in once.
+
+    Args:
+        browser_pool (BrowserPool): The session-wide browser pool
+        browser_context_args (dict): Context arguments configured above
+        tmp_path_factory: pytest's session temporary directory factory
+
+    Returns:
+        str: Path of the saved storage state JSON file
+    """
+    state_path = tmp_path_factory.mktemp("auth") / "admin.json"
+    context = browser_pool.new_context(**browser_context_args)
+    block_nonessential_requests(context)
+    try:
+        LoginPage.for_page(context.new_page()).login_with_api(ADMIN_EMAIL, ADMIN_PASSWORD)
+        context.storage_state(path=state_path)
+    finally:
+        context.close()
+    return str(state_path)
+
+
+@pytest.fixture
+def admin_page(request, login_mode):
+    """
+    Provide a page on the application home screen, logged in as the admin.
+
+    With --login-mode=ui the page comes from the page fixture and goes
+    through the full login_with_otp() flow. With --login-mode=api a fresh
+    context is created from admin_storage_state, so the login screens are
+    skipped entirely.
+
+    Args:
+        request: The pytest fixture request
+        login_mode (str): Either "ui" or "api"
+
+    Yields:
+        Page: The logged-in page
+    """
+    if login_mode != "api":
+        page = request.getfixturevalue("page")
+        LoginPage.for_page(page).login_with_otp(ADMIN_EMAIL, ADMIN_PASSWORD)
+        yield page
+        return
+
+    browser_pool = request.getfixturevalue("browser_pool")
+    browser_context_args = request.getfixturevalue("browser_context_args")
+    storage_state = request.getfixturevalue("admin_storage_state")
+    context = browser_pool.new_context(**browser_context_args, storage_state=storage_state)
+    _track_context(request, context)
+    block_nonessential_requests(context)
+    page = context.new_page()
+    LoginPage.for_page(page).open_home()
+    yield page
+    context.close()
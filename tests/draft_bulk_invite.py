@@ -1,51 +1,59 @@
 """ This is a draft of the bulk invite test. It is not used in the project. """
 
 from playwright.sync_api import sync_playwright, Page, expect
-import csv
+import logging
 import random
 import string
 import tempfile
 import os
-import time
+import re
+
+log = logging.getLogger(__name__)
+
+# Saved cookies + localStorage of a logged-in admin, reused to skip the OTP login
+AUTH_STATE_PATH = os.path.join(".auth", "admin.json")
+
+# Requests that slow page loads without affecting the test: analytics and images/fonts
+THIRD_PARTY_PATTERN = re.compile(r"(google-analytics|googletagmanager|segment\.(io|com)|hotjar|intercom|fullstory|doubleclick)")
+STATIC_ASSET_PATTERN = re.compile(r"\.(png|jpe?g|gif|webp|woff2?|ttf|otf)(\?.*)?$")
+
+# Random generator seeded once from the OS, and the cached alphabet for email names
+RNG = random.Random(os.urandom(16))
+LETTERS = string.ascii_lowercase
 
 
 def generate_random_emails(num_emails: int, file_path: str):
     """Generate random emails and save to CSV"""
-    random_emails = []
-    for _ in range(num_emails):
-        name = ''.join(random.choices(string.ascii_lowercase, k=8))
-        email = f"{name}@example.com"
-        random_emails.append(email)
+    random_emails = [f"{''.join(RNG.choices(LETTERS, k=8))}@example.com" for _ in range(num_emails)]
 
-    # Write to CSV
+    # Write to CSV in one call; plain [a-z]+@example.com values need no quoting
     with open(file_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["emails"])  # header
-        for email in random_emails:
-            writer.writerow([email])
+        f.write("emails\n" + "\n".join(random_emails) + "\n")
 
     return random_emails[0], random_emails[1]
 
 
 def login_with_otp(page: Page, username: str, password: str):
-    page.goto("https://app.dev.pemo.io/")
+    # Don't wait for the full load; the fill below waits for the login form
+    page.goto("https://app.dev.pemo.io/", wait_until="commit")
 
-    page.wait_for_selector("text=Log in")
     page.fill("input[name='email']", username)
     page.fill("input[name='password']", password)
     page.click("xpath=//button[@id='login-btn']")
 
-    page.wait_for_selector("button:has-text('Next')", timeout=60000)
-    page.click("button:has-text('Next')")
+    page.click("button:has-text('Next')", timeout=60000)
 
     # OTP entry
     page.wait_for_selector("//input[contains(@class,'MuiOutlinedInput-input') and @type='text']", timeout=10000)
     otp_inputs = page.locator("//input[contains(@class,'MuiOutlinedInput-input') and @type='text']")
     count = otp_inputs.count()
-    for i in range(count):
-        input_box = otp_inputs.nth(i)
-        input_box.click(force=True)
-        page.keyboard.type("5")
+    # MUI OTP boxes auto-advance focus, so one keystroke stream fills them all
+    otp_inputs.first.click(force=True)
+    page.keyboard.type("5" * count)
+    if otp_inputs.last.input_value() != "5":
+        # Widget did not auto-advance: fill each box; all() resolves them once
+        for input_box in otp_inputs.all():
+            input_box.fill("5")
 
     page.click("xpath=(//button[normalize-space()='Confirm'])[1]")
     page.wait_for_selector("text=Home", timeout=60000)
@@ -53,79 +61,87 @@ def login_with_otp(page: Page, username: str, password: str):
 
 def search_and_assert_member(page: Page, email_to_search: str, role_to_assert: str):
     """Search for an invited member and validate role + invite status"""
-    time.sleep(10)  # mimic Robot sleep
-    page.reload()
-
     # Search box
     page.fill("//input[@id='members-search-input']", email_to_search)
-    time.sleep(5)
+
+    # Wait for this search to apply: the email is listed (the search box value
+    # is not matched by get_by_text) and it is the only invited member shown,
+    # so rows from the previous search or other members cannot pass the checks
+    invite_chips = page.locator("//span[contains(@class, 'MuiChip-label') and text()='Invite sent']")
+    expect(page.get_by_text(email_to_search).first).to_be_visible(timeout=20000)
+    expect(invite_chips).to_have_count(1, timeout=20000)
 
     # Assert role
-    page.wait_for_selector(
-        "//p[contains(@class, 'MuiTypography-body1') and "
-        "(text()='Team Member' or text()='Admin' or text()='Accountant')]",
-        timeout=20000,
-    )
-    assert role_to_assert in page.inner_text(
+    expect(page.locator(
         "//p[contains(@class, 'MuiTypography-body1') and "
         "(text()='Team Member' or text()='Admin' or text()='Accountant')]"
-    )
+    ).first).to_contain_text(role_to_assert, timeout=20000)
 
     # Assert invite status
-    page.wait_for_selector(
-        "//span[contains(@class, 'MuiChip-label') and text()='Invite sent']",
-        timeout=20000,
-    )
-    assert "Invite sent" in page.inner_text(
-        "//span[contains(@class, 'MuiChip-label') and text()='Invite sent']"
-    )
-    time.sleep(2)
+    expect(invite_chips).to_contain_text("Invite sent", timeout=20000)
 
 
 def test_bulk_invite_members():
     with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=False,
-            args=["--start-maximized"]
+        # Headless unless HEADED=1 is set for local debugging
+        browser = p.chromium.launch(headless=os.environ.get("HEADED") != "1")
+        # Restore the saved session if there is one
+        restored = os.path.exists(AUTH_STATE_PATH)
+        context = browser.new_context(
+            viewport={"width": 1280, "height": 720},
+            storage_state=AUTH_STATE_PATH if restored else None
         )
-        context = browser.new_context(no_viewport=True)
+        context.route(THIRD_PARTY_PATTERN, lambda route: route.abort())
+        context.route(STATIC_ASSET_PATTERN, lambda route: route.abort())
         page = context.new_page()
 
-        # Login
-        login_with_otp(page, "admin@autotest.io", "Admin@123")
+        if restored:
+            # Go straight to the app
+            page.goto("https://app.dev.pemo.io/", wait_until="commit")
+            login_email = page.locator("input[name='email']")
+            page.locator("text=Home").or_(login_email).first.wait_for(timeout=60000)
+            logged_in = not login_email.is_visible()
+        else:
+            logged_in = False
+
+        if not logged_in:
+            # No saved session (or it expired): log in and save it for next runs
+            login_with_otp(page, "admin@autotest.io", "Admin@123")
+            os.makedirs(os.path.dirname(AUTH_STATE_PATH), exist_ok=True)
+            context.storage_state(path=AUTH_STATE_PATH)
 
         # Navigate to Members & Teams
-        page.wait_for_selector("//span[text()='Members & Teams']", timeout=20000)
-        page.click("//span[text()='Members & Teams']")
+        page.click("//span[text()='Members & Teams']", timeout=20000)
 
-        page.wait_for_selector("//button[@id='invite-btn']", timeout=20000)
-        page.click("//button[@id='invite-btn']")
-        page.wait_for_selector("//button[@id='tab-bulk']")
+        page.click("//button[@id='invite-btn']", timeout=20000)
 
         # Bulk invite tab
-        page.click("//button[@id='tab-bulk']")
+        page.click("//button[@id='tab-bulk']", timeout=20000)
 
         # --- CSV upload flow ---
-        # Step 1: Click upload area first
-        page.wait_for_selector("//p[@title='Upload CSV file']", timeout=20000)
-        page.click("//p[@title='Upload CSV file']")
-
-        # Step 2: Create temp CSV
+        # Step 1: Create temp CSV
         tmp_dir = tempfile.gettempdir()
         csv_path = os.path.join(tmp_dir, "bulk_invite.csv")
         email_1, email_2 = generate_random_emails(2, csv_path)
 
-        # Step 3: Upload CSV file
-        page.set_input_files("input[type='file']", csv_path)
+        # Step 2: Upload CSV file straight to the file input (no upload-area click)
+        page.set_input_files("input[type='file']", csv_path, timeout=20000)
 
-        # Submit
-        page.click("button:has-text('Send invites')")
-        
+        # Submit and wait for the API to answer the invite request before reloading
+        with page.expect_response(
+            lambda r: r.request.method == "POST" and r.url.startswith("https://api.dev.pemo.io"),
+            timeout=30000
+        ) as invite_response:
+            page.click("button:has-text('Send invites')")
+        assert invite_response.value.ok, f"Invite failed: {invite_response.value.status}"
 
-        # Search + assert the first invited email
-        search_and_assert_member(page, email_1, "Team Member")
+        # Reload once to list the new members (the search fill waits for the page)
+        page.reload()
+
+        # Search + assert both invited emails
         search_and_assert_member(page, email_1, "Team Member")
-        print("✅ Bulk invite + search assertion passed!")
+        search_and_assert_member(page, email_2, "Team Member")
+        log.debug("Bulk invite + search assertion passed")
 
         browser.close()
 
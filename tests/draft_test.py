@@ -1,12 +1,14 @@
 """ This is a draft of the company signup  test. It is not used in the project. """
 
-from playwright.sync_api import sync_playwright
-from faker import Faker
+from playwright.sync_api import sync_playwright, expect, TimeoutError as PlaywrightTimeoutError
+from functools import lru_cache
+import logging
+import os
 import requests
 import time
 import json
 
-fake = Faker()
+log = logging.getLogger(__name__)
 
 BASE_URL = "https://app.dev.pemo.io"
 API_BASE_URL = "https://api.dev.pemo.io"  # adjust if API differs
@@ -15,31 +17,39 @@ DEFAULT_LAST_NAME = "Tester"
 DEFAULT_PASSWORD = "StrongPass123!"
 
 
+@lru_cache(maxsize=1)
+def get_fake():
+    """Create the Faker instance on first use (single en_US locale)"""
+    from faker import Faker
+    return Faker("en_US")
+
+
 def test_register_company_uae():
     with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=False,
-            args=["--start-maximized"]
-        )
-        context = browser.new_context(no_viewport=True)
+        # Headless unless HEADED=1 is set for local debugging
+        browser = p.chromium.launch(headless=os.environ.get("HEADED") != "1")
+        context = browser.new_context(viewport={"width": 1280, "height": 720})
         page = context.new_page()
 
         # === Step 1: Open signup page ===
-        page.goto(BASE_URL)
-        page.wait_for_selector("button#signup-btn", timeout=20000).click()
+        page.goto(f"{BASE_URL}/signup", wait_until="commit")
+        signup_btn = page.locator("button#signup-btn")
+        page.locator("text=Get Started").first.or_(signup_btn).first.wait_for(timeout=20000)
+        if signup_btn.is_visible():
+            signup_btn.click()  # /signup fell back to the home screen
         page.wait_for_selector("text=Get Started", timeout=10000)
 
         # === Step 2: Generate email and fill registration form ===
-        company_signup_email = fake.company_email()
-        print("Signup Email:", company_signup_email)
+        company_signup_email = get_fake().company_email()
+        log.debug("Signup Email: %s", company_signup_email)
 
         fill_registration_form(page, company_signup_email)
 
         # === Step 3: Resend email & build redirect URL ===
         token = resend_registration_email(company_signup_email)
         redirect_url = build_redirect_url(token)
-        print("Redirect URL:", redirect_url)
-        page.goto(redirect_url)
+        log.debug("Redirect URL: %s", redirect_url)
+        page.goto(redirect_url, wait_until="commit")
 
         # === Step 4: Fill company details ===
         fill_company_details(page)
@@ -51,9 +61,9 @@ def test_register_company_uae():
         admin_pages_check(page, expected_user_name=f"{DEFAULT_FIRST_NAME} {DEFAULT_LAST_NAME}")
 
         # === Verify stored email in profile ===
-        page.click("//span[contains(text(),'My account')]")
-        page.wait_for_selector("//input[@id='email-input']", timeout=30000)
-        element_text = page.get_attribute("//input[@id='email-input']", "value")
+        page.get_by_text("My account").first.click()
+        # input_value() reads the live .value of the React-controlled input and auto-waits for it
+        element_text = page.locator("#email-input").input_value(timeout=30000)
         assert element_text == company_signup_email, "Email mismatch"
 
         page.screenshot(path="company_.png")
@@ -66,22 +76,33 @@ def fill_registration_form(page, email):
     try:
         frame = page.frame_locator("iframe[title='reCAPTCHA']")
         frame.locator("#recaptcha-anchor").click(timeout=10000)
-        page.wait_for_timeout(2000)
+        # Continue as soon as the checkbox reports it is verified
+        frame.locator("#recaptcha-anchor[aria-checked='true']").wait_for(timeout=10000)
     except Exception:
-        print("⚠️ reCAPTCHA not found / skipped")
+        log.debug("reCAPTCHA not found / skipped")
 
-    # Fill form
+    # Fill form: email is typed so its async validation runs, the rest is set in one call
     page.fill("xpath=(//input[@id='signUp-1-1'])[1]", email)
-    page.fill("input[name='firstName']", DEFAULT_FIRST_NAME)
-    page.fill("input[name='lastName']", DEFAULT_LAST_NAME)
-    page.fill("input[name='password']", DEFAULT_PASSWORD)
-    page.fill("input[name='repeatPassword']", DEFAULT_PASSWORD)
+    page.evaluate("""([fn, ln, pw]) => {
+        const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+        const set = (sel, val) => {
+            const el = document.querySelector(sel);
+            setter.call(el, val);
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+        };
+        set("input[name='firstName']", fn);
+        set("input[name='lastName']", ln);
+        set("input[name='password']", pw);
+        set("input[name='repeatPassword']", pw);
+    }""", [DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_PASSWORD])
 
     # Select dropdown
     page.locator("//div[contains(@class, 'MuiSelect-outlined') and @role='combobox']").click()
     page.locator("//li[normalize-space()='Social Media']").click()
 
-    page.wait_for_timeout(2000)
+    # Wait for the dropdown menu to close instead of a fixed sleep
+    page.locator("li:has-text('Social Media')").wait_for(state="hidden")
     page.click("button#get-started-submit-btn")
 
 
@@ -91,7 +112,7 @@ def resend_registration_email(email):
     headers = {"Content-Type": "application/json"}
     response = requests.post(f"{API_BASE_URL}/identity/v1/auth/resend-registration-email",
                              json=body, headers=headers)
-    print("Resend Email Status:", response.status_code)
+    log.debug("Resend Email Status: %s", response.status_code)
     assert response.status_code == 200
     data = response.json()
     return data.get("token", None)
@@ -104,7 +125,7 @@ def build_redirect_url(token):
 def fill_company_details(page):
     """Fill out UAE company details"""
     page.wait_for_selector("input[name='name']", timeout=20000)
-    company_name = fake.company()
+    company_name = get_fake().company()
     page.fill("input[name='name']", company_name)
 
     page.fill("input[name='contactNumber']", "98765321")
@@ -117,52 +138,77 @@ def fill_company_details(page):
     page.click("//p[normalize-space()='51 to 250 employees']")
 
     page.click("button#register-business-submit-btn")
-    page.wait_for_timeout(5000)
+    # Wait for the survey's first field instead of a fixed sleep
+    page.get_by_label("Select a team").first.wait_for(timeout=20000)
 
 
 def fill_survey(page):
     """Fill survey form"""
-    team_dropdown = "//label[contains(text(), 'Select a team')]/following-sibling::div//div[@role='combobox']"
-    page.click(team_dropdown)
-    page.click("//li[@role='option' and @data-value='Engineering / IT']")
-
-    role_dropdown = "//label[contains(text(), 'Select a role')]/following-sibling::div//div[@role='combobox']"
-    page.click(role_dropdown)
-    page.click("//li[text()='Manager']")
-
-    page.click("(//button[normalize-space()='Save'])[1]")
-    page.wait_for_selector("text=Get started", timeout=20000)
+    # Bind each element once, then act on the stored handles
+    team_dropdown = page.get_by_label("Select a team").first
+    team_option = page.get_by_role("option", name="Engineering / IT", exact=True)
+    role_dropdown = page.get_by_label("Select a role").first
+    role_option = page.get_by_role("option", name="Manager", exact=True)
+    save_button = page.get_by_role("button", name="Save", exact=True).first
+    get_started = page.get_by_text("Get started").first
+
+    team_dropdown.click()
+    team_option.click()
+
+    role_dropdown.click()
+    role_option.click()
+
+    save_button.click()
+    get_started.wait_for(timeout=20000)
+
+
+# Returns the labels that are not currently shown as the trimmed text of a visible element
+MISSING_LABELS_JS = """labels => {
+    const seen = new Set();
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const text = walker.currentNode.textContent.trim();
+        if (!labels.includes(text)) continue;
+        const r = walker.currentNode.parentElement.getBoundingClientRect();
+        if (r.width > 0 && r.height > 0) seen.add(text);
+    }
+    return labels.filter(label => !seen.has(label));
+}"""
+
+
+def expect_labels_visible(page, labels, timeout=5000):
+    """Wait until every label is visible, polling all of them inside the page in one call"""
+    try:
+        page.wait_for_function(f"labels => ({MISSING_LABELS_JS})(labels).length === 0", arg=labels, timeout=timeout)
+    except PlaywrightTimeoutError:
+        missing = page.evaluate(MISSING_LABELS_JS, labels)
+        raise AssertionError(f"Labels not visible: {missing}")
 
 
 def admin_pages_check(page, expected_user_name):
     """Verify admin pages after login"""
-    page.wait_for_selector("text=Get started", timeout=30000)
-    assert page.is_visible("text=Home")
-    assert page.is_visible("text=Card expenses")
-    assert page.is_visible("text=Cards")
-    assert page.is_visible("text=Requests")
-    assert page.is_visible("text=Transactions")
-    assert page.is_visible("text=Statements")
-    assert page.is_visible("text=Accounting export")
-    assert page.is_visible("text=Members & Teams")
-
-    page.click("//span[normalize-space()='More']")
-    assert page.is_visible("text=Invoices")
-    assert page.is_visible("text=Reimbursements")
-    assert page.is_visible("text=Budgets")
-    assert page.is_visible("text=Approval policies")
-    assert page.is_visible("text=Submission policies")
-    assert page.is_visible("text=Receipts inbox")
-
-    page.click("//span[normalize-space()='Settings']")
-    assert page.is_visible("text=Billing")
-    assert page.is_visible("text=Subscription plans")
+    # Menu handles are bound once up front and reused for the clicks and checks below
+    more_button = page.get_by_text("More", exact=True).first
+    settings_button = page.get_by_text("Settings", exact=True).first
+    user_full_name = page.locator("#user-full-name")
+
+    page.get_by_text("Get started").first.wait_for(timeout=30000)
+    expect_labels_visible(page, [
+        "Home", "Card expenses", "Cards", "Requests",
+        "Transactions", "Statements", "Accounting export", "Members & Teams",
+    ])
+
+    more_button.click()
+    expect_labels_visible(page, [
+        "Invoices", "Reimbursements", "Budgets",
+        "Approval policies", "Submission policies", "Receipts inbox",
+    ])
+
+    settings_button.click()
+    expect_labels_visible(page, ["Billing", "Subscription plans"])
 
     # Open user menu
-    page.click("xpath=//span[@id='user-full-name']")
-    assert page.is_visible("text=My account")
-    assert page.is_visible("text=Email notifications")
-    assert page.is_visible("text=Logout")
+    user_full_name.click()
+    expect_labels_visible(page, ["My account", "Email notifications", "Logout"])
 
-    user_name = page.inner_text("#user-full-name")
-    assert expected_user_name in user_name
+    expect(user_full_name).to_contain_text(expected_user_name)
@@ -5,8 +5,38 @@
 # and URL construction for the test automation framework.
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from config.environments import API_URL, HOME_URL
 
+# Shared HTTP Session
+# ===================
+# One keep-alive session for every API call in the process, so repeated calls
+# to the same host reuse the pooled TCP connection and TLS session instead of
+# opening a new connection per request
+#
+# Transient gateway errors (e.g. during dev environment deploys) are retried
+# up to 3 times with exponential backoff before the call fails, which is far
+# cheaper than re-running the browser flow around it. With urllib3 2.x and
+# backoff_factor=0.3 the first retry is immediate, then 0.6s and 1.2s pass.
+# POST is retried too: the endpoints called here only (re)send or read data.
+# raise_on_status=False hands the last response back to the caller, so
+# raise_for_status() reports the real status instead of a RetryError.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+_session = requests.Session()
+_session.headers.update({"Content-Type": "application/json"})
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=_RETRY))
+
+API_CONNECT_TIMEOUT = 3  # Seconds to wait for a TCP/TLS connection before failing
+API_READ_TIMEOUT = 10    # Seconds to wait for an API response before failing
+API_TIMEOUT = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)  # (connect, read) tuple for requests
+
 def resend_registration_email(email: str) -> str:
     """
     Trigger the resend registration email API endpoint and extract the verification token.
@@ -23,22 +53,25 @@ def resend_registration_email(email: str) -> str:
         str: The verification token extracted from the API response
         
     Raises:
-        AssertionError: If the API returns a non-200 status code
+        requests.HTTPError: If the API still returns an error status after retries
+        requests.ConnectionError: If the API cannot be reached within the connect timeout
+        requests.Timeout: If the API does not respond within the read timeout
         
     Note:
         This endpoint is typically used when testing the complete user registration
         flow, as it allows bypassing the actual email delivery mechanism.
     """
     # Make POST request to the resend registration email endpoint
-    response = requests.post(
+    # The shared session supplies the JSON content type and a pooled connection
+    response = _session.post(
         f"{API_URL}/identity/v1/auth/resend-registration-email",
         json={"email": email},
-        headers={"Content-Type": "application/json"}
+        timeout=API_TIMEOUT
     )
     
-    # Assert that the API call was successful
+    # Fail on any error status left after the retry adapter gave up
     # This ensures the test fails early if there are API issues
-    assert response.status_code == 200, f"Unexpected status: {response.status_code}, {response.text}"
+    response.raise_for_status()
     
     # Extract and return the verification token from the response
     return response.json().get("token")
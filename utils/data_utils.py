@@ -4,11 +4,26 @@
 # default values used throughout the test automation framework.
 # It uses the Faker library to generate realistic test data.
 
-from faker import Faker
+from collections import deque
+from functools import lru_cache
 import re
+import uuid
 
-# Initialize Faker instance for generating fake data
-fake = Faker()
+@lru_cache(maxsize=1)
+def _faker():
+    """
+    Create the shared Faker instance on first use.
+    
+    Faker is imported and its locale providers are loaded only when a
+    caller actually needs fake data, so processes that only generate
+    test emails never pay that cost. The locale is pinned to en_US so
+    only that locale's providers are ever loaded.
+    
+    Returns:
+        Faker: The process-wide Faker instance
+    """
+    from faker import Faker
+    return Faker("en_US")
 
 # Default Test User Configuration
 # ==============================
@@ -17,19 +32,34 @@ fake = Faker()
 DEFAULT_FIRST_NAME = "Automation"  # Standard first name for test users
 DEFAULT_LAST_NAME = "Tester"       # Standard last name for test users
 DEFAULT_PASSWORD = "StrongPass123!" # Strong password meeting security requirements
+TEST_EMAIL_DOMAIN = "autotest.io"   # Domain of generated signup emails (same as the admin account)
+
+# Company Name Pool
+# =================
+# Pre-generated company names consumed one at a time by next_company_name()
+# Names are popped, never reused, so every caller still gets a fresh value
+COMPANY_NAME_POOL_SIZE = 64         # Number of names generated per refill
+_company_name_pool = deque()
+
+# Company Name Cleaning
+# =====================
+# Compiled once at import; matches every run of characters that are not
+# letters, numbers or spaces
+_SPECIAL_CHARS = re.compile(r'[^A-Za-z0-9 ]+')
 
 def generate_test_email() -> str:
     """
-    Generate a unique random company email for user signup testing.
+    Generate a unique random email for user signup testing.
     
     Returns:
-        str: A unique fake company email address (e.g., "john.doe@acme-corp.com")
+        str: A unique email address (e.g., "autotest+3f9c0a1b2d@autotest.io")
         
     Note:
-        Uses Faker's unique company_email() method to ensure no duplicate emails
-        are generated within the same test session.
+        Uniqueness comes from a random UUID suffix, so no per-session record
+        of previously generated emails is kept (unlike Faker's unique proxy)
+        and Faker is not needed at all.
     """
-    return fake.unique.company_email()
+    return f"autotest+{uuid.uuid4().hex[:10]}@{TEST_EMAIL_DOMAIN}"
 
 def generate_company_name() -> str:
     """
@@ -49,14 +79,33 @@ def generate_company_name() -> str:
         Output: "Johnson Smith Associates Inc"
     """
     # Generate a fake company name using Faker
-    name = fake.company()
+    name = _faker().company()
     
     # Clean the company name by removing special characters
     # Keep only letters, numbers, and spaces for form compatibility
-    clean_name = re.sub(r'[^A-Za-z0-9 ]+', '', name)
+    clean_name = _SPECIAL_CHARS.sub('', name)
     
     # Normalize multiple consecutive spaces into single spaces
     # and remove leading/trailing whitespace
-    clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+    # str.split() without arguments does both in one C-level pass
+    clean_name = ' '.join(clean_name.split())
     
     return clean_name
+
+def next_company_name() -> str:
+    """
+    Return the next company name from a pre-generated session pool.
+    
+    The pool is filled in batches of COMPANY_NAME_POOL_SIZE names using
+    generate_company_name(), so the Faker and regex cleaning work is
+    amortized across calls instead of paid on every form submission.
+    Each name is handed out only once.
+    
+    Returns:
+        str: A clean company name without special characters
+    """
+    # Refill the pool in one batch when it runs empty
+    if not _company_name_pool:
+        _company_name_pool.extend(generate_company_name() for _ in range(COMPANY_NAME_POOL_SIZE))
+    
+    return _company_name_pool.popleft()
@@ -0,0 +1,44 @@
+# Form Utilities Module
+# =====================
+# This module provides helpers for filling form inputs with fewer browser
+# round-trips than one Playwright fill() call per field. It is shared by the
+# page objects that populate several plain text inputs in a row.
+
+from playwright.sync_api import Locator
+
+# In-Page Input Setter
+# ====================
+# Sets each input through the native HTMLInputElement value setter so that
+# React's value tracker notices the change, then dispatches bubbling "input"
+# and "change" events so form validators run as they would for typed input.
+_SET_INPUT_VALUES_JS = """(anchor, pairs) => {
+    const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+    for (const [selector, value] of pairs) {
+        const el = document.querySelector(selector);
+        if (!el) throw new Error(`Input not found: ${selector}`);
+        setter.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+}"""
+
+def set_input_values(anchor: Locator, values: dict, timeout: float = None):
+    """
+    Fill several text inputs with a single in-page evaluate() call.
+
+    The call is made on an anchor Locator (typically the first field of the
+    form), so Playwright still auto-waits for the form to be attached before
+    any value is set. Every field is then populated inside the page in one
+    protocol round-trip instead of one fill() per field.
+
+    Args:
+        anchor (Locator): Locator for an element of the form, used to wait for it
+        values (dict): Mapping of CSS selector to the value to set
+        timeout (float): Optional maximum time in milliseconds to wait for the anchor
+
+    Note:
+        Only use this for plain text inputs whose validators react to synthetic
+        "input"/"change" events. Fields that need real keystrokes should keep
+        using Locator.fill().
+    """
+    anchor.evaluate(_SET_INPUT_VALUES_JS, [list(pair) for pair in values.items()], timeout=timeout)
@@ -0,0 +1,36 @@
+# Network Utilities Module
+# ========================
+# This module provides helpers for shaping the network traffic of a browser
+# context during tests. It blocks third-party analytics and heavy static
+# assets that add page-load latency without affecting what the tests assert.
+
+import re
+from playwright.sync_api import BrowserContext
+
+# Blocked Request Patterns
+# ========================
+# Analytics, tag-manager and session-recording hosts loaded by the web app
+_THIRD_PARTY_PATTERN = re.compile(
+    r"(google-analytics|googletagmanager|segment\.(io|com)|hotjar|intercom|fullstory|doubleclick)"
+)
+# Images and web fonts; the tests only assert on text and form controls
+_STATIC_ASSET_PATTERN = re.compile(r"\.(png|jpe?g|gif|webp|woff2?|ttf|otf)(\?.*)?$")
+
+def block_nonessential_requests(context: BrowserContext):
+    """
+    Abort third-party analytics, image and font requests for a browser context.
+
+    The routes are registered with specific patterns rather than a catch-all
+    handler, so only matching requests are intercepted and every other
+    request goes straight to the network.
+
+    Args:
+        context (BrowserContext): The browser context to install the routes on
+
+    Note:
+        Call this right after creating the context and before opening pages,
+        so the first navigation is already covered. Do not use it in tests
+        that assert on images or rely on analytics side effects.
+    """
+    context.route(_THIRD_PARTY_PATTERN, lambda route: route.abort())
+    context.route(_STATIC_ASSET_PATTERN, lambda route: route.abort())